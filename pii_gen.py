@@ -8,16 +8,29 @@ import logging
 import sys
 import time
 import os
+from datetime import date
+from itertools import chain, islice
 from pathlib import Path
 from typing import Optional
 import yaml
 import json
 
-from src.core.models import GenerationConfig, DataQualityProfile
-from src.core.performance import PerformanceOptimizer
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard library JSON encoder
+    orjson = None
+
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    # libyaml bindings unavailable, use the pure-Python implementation
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+from src.core.models import GenerationConfig, VARIABILITY_PROFILES
+from src.core.performance import PerformanceOptimizer, tune_gc_for_generation
 from src.core.database_config import DatabaseConfig
 from src.generators.person_generator import PersonGenerator
-from src.db.azure_sql import EnhancedAzureSQLDatabase
 
 
 # Configure logging
@@ -28,6 +41,76 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# File extension written for each output format ('.ndjson' is listed before
+# '.json' so format inference matches it first)
+OUTPUT_FORMATS = {
+    'csv': '.csv',
+    'ndjson': '.ndjson',
+    'json': '.json',
+    'parquet': '.parquet',
+    'arrow': '.arrow',
+}
+
+# date32 columns count days from the Unix epoch
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _load_config_cached(config_path):
+    """Load a YAML/JSON config file, reusing a JSON sidecar of an unchanged YAML source"""
+    if not (config_path.endswith('.yaml') or config_path.endswith('.yml')):
+        with open(config_path, 'r') as f:
+            return json.load(f)
+    
+    # The sidecar records the source's modification time and size it was built
+    # from, so any replacement of the source (even with an older file) misses
+    source = os.stat(config_path)
+    source_key = [source.st_mtime_ns, source.st_size]
+    
+    cache_path = config_path + '.cache.json'
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+        if cached['source'] == source_key:
+            return cached['config']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    with open(config_path, 'r') as f:
+        config = yaml.load(f, Loader=YamlLoader)
+    
+    # Only cache configs that survive a JSON round trip unchanged (no dates, non-str keys)
+    try:
+        serialized = json.dumps({'source': source_key, 'config': config})
+        if json.loads(serialized)['config'] == config:
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(serialized)
+            os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not write config cache {cache_path}: {e}")
+    
+    return config
+
+
+def _apply_db_overrides(db_config, connection_string, server, database, username, password, port, schema):
+    """Apply the connection/schema command-line options to a database config"""
+    connection = db_config.database
+    
+    if connection_string:
+        connection.connection_method = 'connection_string'
+        connection.connection_string = connection_string
+    elif server and database and username and password:
+        connection.connection_method = 'individual_params'
+        connection.server = server
+        connection.database = database
+        connection.username = username
+        connection.password = password
+        connection.port = port
+    
+    db_config.schema_config.name = schema
+    return db_config
+
+
 @click.group()
 @click.option('--config', '-c', type=click.Path(exists=True), help='Generation configuration file path')
 @click.option('--db-config', type=click.Path(exists=True), help='Database configuration file path')
@@ -42,20 +125,20 @@ def cli(ctx, config, db_config, verbose):
     
     # Load generation configuration
     if config:
-        with open(config, 'r') as f:
-            if config.endswith('.yaml') or config.endswith('.yml'):
-                ctx.obj['config'] = yaml.safe_load(f)
-            else:
-                ctx.obj['config'] = json.load(f)
+        ctx.obj['config'] = _load_config_cached(config)
     else:
         ctx.obj['config'] = {}
     
     # Load database configuration
-    if db_config:
-        ctx.obj['db_config'] = DatabaseConfig.from_yaml(db_config)
-    else:
-        # Try to load from environment or use defaults
-        ctx.obj['db_config'] = DatabaseConfig.from_env()
+    try:
+        if db_config:
+            ctx.obj['db_config'] = DatabaseConfig.from_yaml(db_config)
+        else:
+            # Try to load from environment or use defaults
+            ctx.obj['db_config'] = DatabaseConfig.from_env()
+    except ValueError as e:
+        click.echo(f"❌ Invalid database configuration: {e}", err=True)
+        sys.exit(1)
 
 
 @cli.command()
@@ -71,22 +154,13 @@ def test_connection(ctx, server, database, username, password, port, connection_
     """Test database connection"""
     
     # Create database config from parameters
-    db_config = ctx.obj.get('db_config', DatabaseConfig())
-    
-    if connection_string:
-        db_config.database.connection_method = 'connection_string'
-        db_config.database.connection_string = connection_string
-    elif server and database and username and password:
-        db_config.database.connection_method = 'individual_params'
-        db_config.database.server = server
-        db_config.database.database = database
-        db_config.database.username = username
-        db_config.database.password = password
-        db_config.database.port = port
-    
-    db_config.schema_config.name = schema
+    db_config = _apply_db_overrides(
+        ctx.obj.get('db_config', DatabaseConfig()),
+        connection_string, server, database, username, password, port, schema
+    )
     
     # Test connection
+    from src.db.azure_sql import EnhancedAzureSQLDatabase
     db = EnhancedAzureSQLDatabase(db_config)
     
     click.echo("Testing database connection...")
@@ -96,7 +170,7 @@ def test_connection(ctx, server, database, username, password, port, connection_
         # Show connection details (without password)
         click.echo(f"Server: {db_config.database.server}")
         click.echo(f"Database: {db_config.database.database}")
-        click.echo(f"Schema: {db_config.schema.name}")
+        click.echo(f"Schema: {db_config.schema_config.name}")
     else:
         click.echo("❌ Database connection failed!")
         sys.exit(1)
@@ -120,24 +194,15 @@ def setup_schema(ctx, server, database, username, password, port, connection_str
     """Setup database schema with flexible options"""
     
     # Create database config from parameters
-    db_config = ctx.obj.get('db_config', DatabaseConfig())
-    
-    if connection_string:
-        db_config.database.connection_method = 'connection_string'
-        db_config.database.connection_string = connection_string
-    elif server and database and username and password:
-        db_config.database.connection_method = 'individual_params'
-        db_config.database.server = server
-        db_config.database.database = database
-        db_config.database.username = username
-        db_config.database.password = password
-        db_config.database.port = port
-    
-    db_config.schema_config.name = schema
-    db_config.schema.table_behavior = table_behavior
-    db_config.schema.table_prefix = table_prefix
+    db_config = _apply_db_overrides(
+        ctx.obj.get('db_config', DatabaseConfig()),
+        connection_string, server, database, username, password, port, schema
+    )
+    db_config.schema_config.table_behavior = table_behavior
+    db_config.schema_config.table_prefix = table_prefix
     
     # Setup schema
+    from src.db.azure_sql import EnhancedAzureSQLDatabase
     db = EnhancedAzureSQLDatabase(db_config)
     
     click.echo(f"Setting up database schema with behavior: {table_behavior}")
@@ -154,8 +219,12 @@ def setup_schema(ctx, server, database, username, password, port, connection_str
 @cli.command()
 @click.option('--records', '-n', default=1000, help='Number of records to generate')
 @click.option('--threads', '-t', default=4, help='Number of threads to use')
+@click.option('--mode', default='process', type=click.Choice(['process', 'thread']),
+              help='Run parallel generation in worker processes or threads')
 @click.option('--batch-size', '-b', default=1000, help='Batch size for processing')
-@click.option('--output', '-o', type=click.Path(), help='Output file path (CSV/JSON)')
+@click.option('--output', '-o', type=click.Path(), help='Output file path (CSV/JSON/NDJSON/Parquet/Arrow)')
+@click.option('--format', 'output_format', type=click.Choice(list(OUTPUT_FORMATS)),
+              help='Output file format (default: inferred from the output extension, else CSV)')
 @click.option('--server', help='Database server hostname')
 @click.option('--database', help='Database name')
 @click.option('--username', help='Database username')
@@ -170,70 +239,43 @@ def setup_schema(ctx, server, database, username, password, port, connection_str
 @click.option('--insert-mode', default='append',
               type=click.Choice(['append', 'skip_duplicates']),
               help='Data insertion mode')
+@click.option('--bulk-mode', default='executemany',
+              type=click.Choice(['executemany', 'bcp']),
+              help='Database load path (bcp requires the bcp utility on PATH and trusted or '
+                   'Azure AD authentication; SQL passwords are not supported)')
 @click.option('--variability-profile', default='realistic', 
-              type=click.Choice(['minimal', 'realistic', 'messy', 'extreme']),
+              type=click.Choice(list(VARIABILITY_PROFILES)),
               help='Data quality variability profile')
 @click.option('--seed', type=int, help='Random seed for reproducibility')
 @click.option('--families', type=int, help='Number of family clusters to generate')
 @click.option('--dry-run', is_flag=True, help='Show what would be generated without creating data')
 @click.pass_context
-def generate(ctx, records, threads, batch_size, output, server, database, username, password, port,
+def generate(ctx, records, threads, mode, batch_size, output, output_format, server, database, username, password, port,
             connection_string, schema, table_behavior, table_prefix, insert_mode, 
-            variability_profile, seed, families, dry_run):
+            bulk_mode, variability_profile, seed, families, dry_run):
     """Generate synthetic PII data with enhanced configuration"""
     
     if dry_run:
         click.echo(f"Would generate {records:,} records with:")
-        click.echo(f"  Threads: {threads}")
+        click.echo(f"  Threads: {threads} ({mode} mode)")
         click.echo(f"  Batch size: {batch_size}")
         click.echo(f"  Variability profile: {variability_profile}")
         click.echo(f"  Table behavior: {table_behavior}")
         click.echo(f"  Insert mode: {insert_mode}")
+        click.echo(f"  Bulk mode: {bulk_mode}")
         if table_prefix:
             click.echo(f"  Table prefix: {table_prefix}")
         if families:
             click.echo(f"  Family clusters: {families}")
         return
     
-    # Create data quality profile
-    variability_profiles = {
-        'minimal': DataQualityProfile(
-            missing_data_rate=0.01,
-            typo_rate=0.005,
-            duplicate_rate=0.0001,
-            outlier_rate=0.001,
-            inconsistency_rate=0.01
-        ),
-        'realistic': DataQualityProfile(
-            missing_data_rate=0.05,
-            typo_rate=0.02,
-            duplicate_rate=0.001,
-            outlier_rate=0.01,
-            inconsistency_rate=0.03
-        ),
-        'messy': DataQualityProfile(
-            missing_data_rate=0.15,
-            typo_rate=0.05,
-            duplicate_rate=0.005,
-            outlier_rate=0.03,
-            inconsistency_rate=0.08
-        ),
-        'extreme': DataQualityProfile(
-            missing_data_rate=0.25,
-            typo_rate=0.10,
-            duplicate_rate=0.01,
-            outlier_rate=0.05,
-            inconsistency_rate=0.15
-        )
-    }
-    
     # Create generation config
     config = GenerationConfig(
         num_records=records,
         batch_size=batch_size,
         num_threads=threads,
         seed=seed,
-        data_quality_profile=variability_profiles[variability_profile]
+        data_quality_profile=VARIABILITY_PROFILES[variability_profile]
     )
     
     # Merge with file config if provided
@@ -248,74 +290,91 @@ def generate(ctx, records, threads, batch_size, output, server, database, userna
     # Initialize generators
     person_gen = PersonGenerator(config)
     performance_opt = PerformanceOptimizer(config)
+    # This process exists to generate (families, thread mode) and write records
+    tune_gc_for_generation()
     
-    # Generate families or individual records
-    if families:
-        click.echo(f"Generating {families} family clusters...")
-        family_clusters = person_gen.create_family_clusters(families)
-        all_people = [person for family in family_clusters for person in family]
-        
-        # Generate additional individual records if needed
-        remaining = records - len(all_people)
-        if remaining > 0:
-            click.echo(f"Generating {remaining} additional individual records...")
-            for batch in performance_opt.generate_parallel(
-                person_gen.generate_person, remaining, batch_size, threads
-            ):
-                all_people.extend(batch)
-    else:
-        # Generate individual records
-        all_people = []
-        for batch in performance_opt.generate_parallel(
-            person_gen.generate_person, records, batch_size, threads
-        ):
-            all_people.extend(batch)
-    
-    elapsed = time.time() - start_time
-    rate = len(all_people) / elapsed if elapsed > 0 else 0
-    
-    click.echo(f"Generated {len(all_people):,} records in {elapsed:.2f} seconds ({rate:.0f} records/sec)")
+    # Set up the sinks first so each batch can be written and inserted as soon
+    # as it is generated instead of holding every record in memory
+    writer = OutputWriter(output, output_format) if output else None
+    if writer:
+        click.echo(f"Writing to {writer.output_path}...")
     
-    # Output data to file
-    if output:
-        click.echo(f"Writing to {output}...")
-        write_output(all_people, output)
-    
-    # Insert to database
+    db = None
     if any([server, database, username, password, connection_string]):
         # Create database config from parameters
-        db_config = ctx.obj.get('db_config', DatabaseConfig())
-        
-        if connection_string:
-            db_config.database.connection_method = 'connection_string'
-            db_config.database.connection_string = connection_string
-        elif server and database and username and password:
-            db_config.database.connection_method = 'individual_params'
-            db_config.database.server = server
-            db_config.database.database = database
-            db_config.database.username = username
-            db_config.database.password = password
-            db_config.database.port = port
-        
-        db_config.schema_config.name = schema
-        db_config.schema.table_behavior = table_behavior
-        db_config.schema.table_prefix = table_prefix
+        db_config = _apply_db_overrides(
+            ctx.obj.get('db_config', DatabaseConfig()),
+            connection_string, server, database, username, password, port, schema
+        )
+        db_config.schema_config.table_behavior = table_behavior
+        db_config.schema_config.table_prefix = table_prefix
         db_config.data_insertion.mode = insert_mode
         db_config.data_insertion.batch_size = batch_size
+        db_config.data_insertion.bulk_mode = bulk_mode
+        
+        # The database layer needs pyodbc and an ODBC driver manager, so it is
+        # only imported when records go to a database rather than just a file
+        from src.db.azure_sql import EnhancedAzureSQLDatabase
         
         click.echo("Setting up database schema...")
-        db = EnhancedAzureSQLDatabase(db_config)
+        try:
+            db = EnhancedAzureSQLDatabase(db_config)
+        except ValueError as e:
+            click.echo(f"❌ {e}", err=True)
+            sys.exit(1)
         
         if db.setup_schema():
             click.echo("Inserting data to database...")
-            success = db.bulk_insert_people(all_people, batch_size)
-            
-            if success:
-                click.echo("✅ Successfully inserted data to database")
-            else:
-                click.echo("❌ Failed to insert data to database", err=True)
         else:
             click.echo("❌ Failed to setup database schema", err=True)
+            db = None
+    
+    def generate_batches():
+        # Generate families or individual records
+        remaining = records
+        if families:
+            click.echo(f"Generating {families} family clusters...")
+            family_clusters = person_gen.create_family_clusters(families)
+            family_members = list(chain.from_iterable(family_clusters))
+            remaining -= len(family_members)
+            yield family_members
+            
+            # Generate additional individual records if needed
+            if remaining > 0:
+                click.echo(f"Generating {remaining} additional individual records...")
+        
+        if remaining > 0:
+            yield from performance_opt.generate_parallel(
+                person_gen.generate_person, remaining, batch_size, threads, mode=mode
+            )
+    
+    total_generated = 0
+    db_success = True
+    try:
+        for batch in generate_batches():
+            total_generated += len(batch)
+            
+            # Output data to file
+            if writer:
+                writer.write_batch(batch)
+            
+            # Insert to database
+            if db:
+                db_success = db.bulk_insert_people(batch, batch_size) and db_success
+    finally:
+        if writer:
+            writer.close()
+    
+    elapsed = time.time() - start_time
+    rate = total_generated / elapsed if elapsed > 0 else 0
+    
+    click.echo(f"Generated {total_generated:,} records in {elapsed:.2f} seconds ({rate:.0f} records/sec)")
+    
+    if db:
+        if db_success:
+            click.echo("✅ Successfully inserted data to database")
+        else:
+            click.echo("❌ Failed to insert data to database", err=True)
 
 
 @cli.command()
@@ -363,77 +422,295 @@ def create_db_config(output):
         }
         
         with open(output, 'w') as f:
-            yaml.dump(basic_config, f, default_flow_style=False)
+            yaml.dump(basic_config, f, Dumper=YamlDumper, default_flow_style=False)
         
         click.echo(f"Basic database configuration created: {output}")
 
 
-def write_output(people, output_path):
-    """Write people data to output file"""
-    import pandas as pd
-    
-    # Convert to flat format
-    records = []
-    for person in people:
-        # Flatten person data
-        record = {
-            'person_id': person.person_id,
-            'ssn': person.ssn,
-            'first_name': person.first_name,
-            'middle_name': person.middle_name,
-            'last_name': person.last_name,
-            'full_name': f"{person.first_name} {person.last_name}",
-            'date_of_birth': person.date_of_birth,
-            'gender': person.gender if isinstance(person.gender, str) else person.gender.value,
-        }
+def _person_columns(people):
+    """Flatten a batch of people into output columns"""
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    
+    num_people = len(people)
+    
+    # Build one preallocated column per output field in a single pass
+    # (column-oriented, so no per-record dicts are built); slots for missing
+    # values simply stay None
+    person_ids = [None] * num_people
+    ssns = [None] * num_people
+    first_names = [None] * num_people
+    middle_names = [None] * num_people
+    last_names = [None] * num_people
+    genders = [None] * num_people
+    streets = [None] * num_people
+    cities = [None] * num_people
+    states = [None] * num_people
+    zip_codes = [None] * num_people
+    area_codes = [None] * num_people
+    phone_numbers = [None] * num_people
+    emails = [None] * num_people
+    employers = [None] * num_people
+    job_titles = [None] * num_people
+    
+    # Numeric fields go straight into typed buffers; NaN marks a missing value
+    salaries = np.full(num_people, np.nan)
+    credit_scores = np.zeros(num_people, dtype=np.int64)
+    annual_incomes = np.full(num_people, np.nan)
+    has_financial = np.zeros(num_people, dtype=bool)
+    # Birth dates as day ordinals (4 bytes each instead of a date object)
+    birth_days = np.empty(num_people, dtype=np.int32)
+    
+    for i, person in enumerate(people):
+        person_ids[i] = person.person_id
+        ssns[i] = person.ssn
+        first_names[i] = person.first_name
+        middle_names[i] = person.middle_name
+        last_names[i] = person.last_name
+        birth_days[i] = person.date_of_birth.toordinal()
+        genders[i] = person.gender
         
         # Current address
-        current_addr = next((a for a in person.addresses if a.address_type == "current"), None)
-        if current_addr:
-            record.update({
-                'address': f"{current_addr.street_1}, {current_addr.city}, {current_addr.state} {current_addr.zip_code}",
-                'city': current_addr.city,
-                'state': current_addr.state,
-                'zip_code': current_addr.zip_code
-            })
+        current_addr = person.current_address
+        if current_addr is not None:
+            streets[i] = current_addr.street_1
+            cities[i] = current_addr.city
+            states[i] = current_addr.state
+            zip_codes[i] = current_addr.zip_code
         
         # Primary contact
-        primary_phone = next((p for p in person.phone_numbers if p.is_primary), None)
-        if primary_phone:
-            record['phone'] = f"({primary_phone.area_code}) {primary_phone.number[:3]}-{primary_phone.number[3:]}"
+        primary_phone = person.primary_phone
+        if primary_phone is not None:
+            area_codes[i] = primary_phone.area_code
+            phone_numbers[i] = primary_phone.number
         
-        primary_email = next((e for e in person.email_addresses if e.is_primary), None)
-        if primary_email:
-            record['email'] = primary_email.email
+        primary_email = person.primary_email
+        if primary_email is not None:
+            emails[i] = primary_email.email
         
         # Current employment
-        current_job = next((e for e in person.employment_history if e.is_current), None)
-        if current_job:
-            record.update({
-                'employer': current_job.employer_name,
-                'job_title': current_job.job_title,
-                'salary': current_job.salary
-            })
+        current_job = person.current_job
+        if current_job is not None:
+            employers[i] = current_job.employer_name
+            job_titles[i] = current_job.job_title
+            if current_job.salary is not None:
+                salaries[i] = current_job.salary
         
         # Financial
-        if person.financial_profile:
-            record.update({
-                'credit_score': person.financial_profile.credit_score,
-                'annual_income': person.financial_profile.annual_income
-            })
+        financial_profile = person.financial_profile
+        if financial_profile:
+            credit_scores[i] = financial_profile.credit_score
+            annual_incomes[i] = financial_profile.annual_income
+            has_financial[i] = True
+    
+    if not has_financial.all():
+        # Missing scores can only be represented as NaN in a float column
+        credit_scores = np.where(has_financial, credit_scores, np.nan)
+    
+    dates_of_birth = pa.array(birth_days - _EPOCH_ORDINAL, pa.date32())
+    
+    # Format the display strings column-wise in Arrow (null where the source is missing)
+    first_names = pa.array(first_names, pa.string())
+    last_names = pa.array(last_names, pa.string())
+    full_names = pc.binary_join_element_wise(first_names, last_names, ' ')
+    
+    streets = pa.array(streets, pa.string())
+    cities = pa.array(cities, pa.string())
+    states = pa.array(states, pa.string())
+    zip_codes = pa.array(zip_codes, pa.string())
+    addresses = pc.binary_join_element_wise(
+        streets, cities, pc.binary_join_element_wise(states, zip_codes, ' '), ', '
+    )
+    
+    phone_numbers = pa.array(phone_numbers, pa.string())
+    phones = pc.binary_join_element_wise(
+        '(', pa.array(area_codes, pa.string()), ') ',
+        pc.utf8_slice_codeunits(phone_numbers, 0, 3), '-',
+        pc.utf8_slice_codeunits(phone_numbers, 3), ''
+    )
+    
+    return {
+        'person_id': person_ids,
+        'ssn': ssns,
+        'first_name': first_names,
+        'middle_name': middle_names,
+        'last_name': last_names,
+        'full_name': full_names,
+        'date_of_birth': dates_of_birth,
+        'gender': genders,
+        'address': addresses,
+        'city': cities,
+        'state': states,
+        'zip_code': zip_codes,
+        'phone': phones,
+        'email': emails,
+        'employer': employers,
+        'job_title': job_titles,
+        'salary': salaries,
+        'credit_score': credit_scores,
+        'annual_income': annual_incomes,
+    }
+
+
+def _dumps_json(record, indent=True):
+    """Serialize one output record to JSON bytes (indented, or compact for NDJSON)"""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(record, indent=2 if indent else None, default=str).encode('utf-8')
+
+
+def _output_schema():
+    """Arrow schema of the flattened output columns"""
+    import pyarrow as pa
+    
+    # Low-cardinality text columns are dictionary-encoded: each distinct value is
+    # stored once and rows hold a small index
+    categorical = pa.dictionary(pa.int16(), pa.string())
+    
+    return pa.schema([
+        ('person_id', pa.string()),
+        ('ssn', pa.string()),
+        ('first_name', pa.string()),
+        ('middle_name', pa.string()),
+        ('last_name', pa.string()),
+        ('full_name', pa.string()),
+        ('date_of_birth', pa.date32()),
+        ('gender', categorical),
+        ('address', pa.string()),
+        ('city', categorical),
+        ('state', categorical),
+        ('zip_code', pa.string()),
+        ('phone', pa.string()),
+        ('email', pa.string()),
+        ('employer', pa.string()),
+        ('job_title', pa.string()),
+        ('salary', pa.float64()),
+        ('credit_score', pa.int64()),
+        ('annual_income', pa.float64()),
+    ])
+
+
+class OutputWriter:
+    """Write batches of people to a CSV/JSON/NDJSON/Parquet/Arrow output file as they are generated"""
+    
+    def __init__(self, output_path, output_format=None):
+        output_path = str(output_path)
+        path_format = next(
+            (fmt for fmt, ext in OUTPUT_FORMATS.items() if output_path.endswith(ext)), None
+        )
+        if output_format is None:
+            # Infer the format from the extension, defaulting to CSV
+            output_format = path_format or 'csv'
+        
+        if path_format != output_format:
+            # An explicit format wins: swap a known output extension for the
+            # format's own instead of stacking a second one (out.csv -> out.parquet)
+            if path_format is not None:
+                output_path = output_path[:-len(OUTPUT_FORMATS[path_format])]
+            output_path += OUTPUT_FORMATS[output_format]
         
-        records.append(record)
+        self.format = output_format
+        self.output_path = output_path
+        self.records_written = 0
+        
+        if self.format == 'json':
+            # Records are streamed into one top-level JSON array
+            self._file = open(output_path, 'wb')
+            self._file.write(b'[')
+        elif self.format == 'ndjson':
+            # One compact JSON object per line, no enclosing array
+            self._file = open(output_path, 'wb')
+        else:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+            import pyarrow.parquet as pq
+            
+            # The schema is fixed up front so every batch (including ones where a
+            # column is entirely missing) is written with the same column types
+            self._schema = _output_schema()
+            if self.format == 'parquet':
+                self._file = pq.ParquetWriter(output_path, self._schema, compression='zstd')
+            elif self.format == 'arrow':
+                # Arrow IPC stream: record batches can be read back without any parsing
+                self._file = pa.ipc.new_stream(output_path, self._schema)
+            else:
+                self._file = pa_csv.CSVWriter(
+                    output_path, self._schema,
+                    write_options=pa_csv.WriteOptions(include_header=True)
+                )
     
-    # Write to file
-    df = pd.DataFrame(records)
+    def write_batch(self, people):
+        """Append a batch of people to the output file"""
+        if not people:
+            return
+        
+        columns = _person_columns(people)
+        
+        if self.format in ('json', 'ndjson'):
+            import numpy as np
+            import pyarrow as pa
+            
+            # NaN in the numeric buffers is written as null
+            names = list(columns)
+            values = []
+            for column in columns.values():
+                if isinstance(column, np.ndarray):
+                    column = [None if v != v else v for v in column.tolist()]
+                elif isinstance(column, pa.Array):
+                    column = column.to_pylist()
+                values.append(column)
+            if self.format == 'ndjson':
+                self._file.writelines(
+                    _dumps_json(dict(zip(names, row)), indent=False) + b'\n' for row in zip(*values)
+                )
+            else:
+                self._file.write(b',\n' if self.records_written else b'\n')
+                self._file.write(b',\n'.join(_dumps_json(dict(zip(names, row))) for row in zip(*values)))
+        else:
+            self._file.write_table(self._to_table(columns))
+        
+        self.records_written += len(people)
     
-    if output_path.endswith('.csv'):
-        df.to_csv(output_path, index=False)
-    elif output_path.endswith('.json'):
-        df.to_json(output_path, orient='records', indent=2)
-    else:
-        # Default to CSV
-        df.to_csv(output_path + '.csv', index=False)
+    def close(self):
+        """Finish the output file"""
+        if self.format == 'json':
+            self._file.write(b'\n]' if self.records_written else b']')
+        
+        self._file.close()
+    
+    def _to_table(self, columns):
+        """Convert flattened columns to an Arrow table (NaN becomes null)"""
+        import pyarrow as pa
+        
+        arrays = []
+        for field in self._schema:
+            column = columns[field.name]
+            if not isinstance(column, pa.Array):
+                column = pa.array(column, type=field.type, from_pandas=True)
+            elif column.type != field.type:
+                column = column.cast(field.type)
+            arrays.append(column)
+        
+        return pa.Table.from_arrays(arrays, schema=self._schema)
+
+
+def write_output(people, output_path, output_format=None, chunk_size=50000):
+    """Write people data to output file
+    
+    people can be any iterable (e.g. a generator); it is written chunk_size
+    records at a time so only one chunk's columns are held in memory.
+    """
+    writer = OutputWriter(output_path, output_format)
+    people = iter(people)
+    try:
+        while True:
+            chunk = list(islice(people, chunk_size))
+            if not chunk:
+                break
+            writer.write_batch(chunk)
+    finally:
+        writer.close()
 
 
 if __name__ == '__main__':
@@ -1,10 +1,25 @@
 """Database configuration management"""
 
-from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 import yaml
 import os
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    # libyaml bindings unavailable, use the pure-Python implementation
+    from yaml import SafeLoader as YamlLoader
+
+
+# Environment variables read by DatabaseConfig.from_env
+ENV_VARS = (
+    'DB_SERVER', 'DB_DATABASE', 'DB_USERNAME', 'DB_PASSWORD', 'DB_PORT',
+    'DB_CONNECTION_STRING', 'DB_SCHEMA', 'DB_TABLE_BEHAVIOR', 'DB_TABLE_PREFIX',
+    'DB_INSERT_MODE', 'DB_BATCH_SIZE', 'DB_BULK_MODE'
+)
+
 
 class ConnectionOptions(BaseModel):
     """Database connection options"""
@@ -30,6 +45,9 @@ class DatabaseConnection(BaseModel):
     # Direct connection string
     connection_string: Optional[str] = None
     
+    # (field values, string) from the last get_connection_string() build
+    _cached_conn_str: Optional[Tuple[tuple, str]] = PrivateAttr(default=None)
+    
     def get_connection_string(self) -> str:
         """Generate connection string from configuration"""
         if self.connection_method == 'connection_string' and self.connection_string:
@@ -39,13 +57,21 @@ class DatabaseConnection(BaseModel):
             if not all([self.server, self.database, self.username, self.password]):
                 raise ValueError("Server, database, username, and password are required for individual_params method")
             
+            # Reuse the last build while none of its inputs have changed
+            options = self.connection_options.__dict__
+            key = (self.driver, self.server, self.port, self.database, self.username,
+                   self.password, tuple(options.items()))
+            if self._cached_conn_str is not None and self._cached_conn_str[0] == key:
+                return self._cached_conn_str[1]
+            
             # Build connection string
-            conn_str = f"Driver={{{self.driver}}};Server={self.server},{self.port};Database={self.database};Uid={self.username};Pwd={self.password};"
+            parts = [f"Driver={{{self.driver}}};Server={self.server},{self.port};Database={self.database};Uid={self.username};Pwd={self.password};"]
             
             # Add connection options
-            for key, value in self.connection_options.dict().items():
-                conn_str += f"{key}={value};"
+            parts.extend(f"{name}={value};" for name, value in options.items())
             
+            conn_str = "".join(parts)
+            self._cached_conn_str = (key, conn_str)
             return conn_str
         
         raise ValueError(f"Invalid connection_method: {self.connection_method}")
@@ -72,12 +98,28 @@ class DataInsertionConfig(BaseModel):
     """Data insertion configuration"""
     mode: str = Field(default='append', description="'append', 'upsert', 'skip_duplicates'")
     batch_size: int = 1000
+    bulk_mode: str = Field(default='executemany', description="'executemany' or 'bcp' (bcp command-line utility)")
     duplicate_key_columns: Dict[str, list] = Field(default_factory=lambda: {
         'people': ['ssn'],
         'addresses': ['person_id', 'address_type', 'street_1', 'city', 'state', 'zip_code'],
         'phone_numbers': ['area_code', 'number'],
         'email_addresses': ['email']
     })
+    
+    # table -> (key columns, WHERE clause) built by get_duplicate_key_sql
+    _duplicate_key_sql: Dict[str, Tuple[tuple, str]] = PrivateAttr(default_factory=dict)
+    
+    def get_duplicate_key_sql(self, table: str) -> Optional[str]:
+        """WHERE clause matching a row on the table's duplicate key columns, or None"""
+        columns = tuple(self.duplicate_key_columns.get(table) or ())
+        if not columns:
+            return None
+        
+        cached = self._duplicate_key_sql.get(table)
+        if cached is None or cached[0] != columns:
+            cached = (columns, " AND ".join(f"{col} = ?" for col in columns))
+            self._duplicate_key_sql[table] = cached
+        return cached[1]
 
 
 class DatabaseConfig(BaseModel):
@@ -89,49 +131,98 @@ class DatabaseConfig(BaseModel):
     class Config:
         populate_by_name = True
     
+    @model_validator(mode='after')
+    def _check_bulk_mode(self) -> 'DatabaseConfig':
+        self.validate_bulk_mode()
+        return self
+    
+    def validate_bulk_mode(self) -> None:
+        """Reject a bulk_mode the connection settings can't support
+        
+        bcp only accepts a SQL password through -P on its command line, where
+        other local users can read it, so it can't be used with individual_params
+        (which always authenticates with a password).
+        """
+        if (self.data_insertion.bulk_mode == 'bcp'
+                and self.database.connection_method == 'individual_params' and self.database.password):
+            raise ValueError(
+                "bulk_mode 'bcp' can't be used with individual_params (SQL password) connections; "
+                "use a connection string with trusted or Azure AD authentication, "
+                "or bulk_mode 'executemany'"
+            )
+    
     @classmethod
     def from_yaml(cls, file_path: str) -> 'DatabaseConfig':
-        """Load configuration from YAML file"""
-        with open(file_path, 'r') as f:
-            data = yaml.safe_load(f)
-        return cls(**data)
+        """Load configuration from YAML file
+        
+        Parsed configs are cached per (path, modification time), so repeated loads
+        of an unchanged file skip the parse; each call returns its own copy.
+        """
+        file_path = os.path.abspath(file_path)
+        config = _load_yaml_config(cls, file_path, os.path.getmtime(file_path))
+        return config.model_copy(deep=True)
     
     @classmethod
     def from_env(cls) -> 'DatabaseConfig':
-        """Load configuration from environment variables"""
+        """Load configuration from environment variables
+        
+        Cached on the values of ENV_VARS; each call returns its own copy.
+        """
+        env = tuple(os.getenv(name) for name in ENV_VARS)
+        return _load_env_config(cls, env).model_copy(deep=True)
+    
+    @classmethod
+    def _from_env_values(cls, env: Dict[str, Optional[str]]) -> 'DatabaseConfig':
+        """Build configuration from a snapshot of the environment variables"""
         config = cls()
         
         # Database connection from environment
-        if os.getenv('DB_SERVER'):
-            config.database.server = os.getenv('DB_SERVER')
-        if os.getenv('DB_DATABASE'):
-            config.database.database = os.getenv('DB_DATABASE')
-        if os.getenv('DB_USERNAME'):
-            config.database.username = os.getenv('DB_USERNAME')
-        if os.getenv('DB_PASSWORD'):
-            config.database.password = os.getenv('DB_PASSWORD')
-        if os.getenv('DB_PORT'):
-            config.database.port = int(os.getenv('DB_PORT'))
-        if os.getenv('DB_CONNECTION_STRING'):
-            config.database.connection_string = os.getenv('DB_CONNECTION_STRING')
+        if env['DB_SERVER']:
+            config.database.server = env['DB_SERVER']
+        if env['DB_DATABASE']:
+            config.database.database = env['DB_DATABASE']
+        if env['DB_USERNAME']:
+            config.database.username = env['DB_USERNAME']
+        if env['DB_PASSWORD']:
+            config.database.password = env['DB_PASSWORD']
+        if env['DB_PORT']:
+            config.database.port = int(env['DB_PORT'])
+        if env['DB_CONNECTION_STRING']:
+            config.database.connection_string = env['DB_CONNECTION_STRING']
             config.database.connection_method = 'connection_string'
         
         # Schema configuration
-        if os.getenv('DB_SCHEMA'):
-            config.schema_config.name = os.getenv('DB_SCHEMA')
-        if os.getenv('DB_TABLE_BEHAVIOR'):
-            config.schema_config.table_behavior = os.getenv('DB_TABLE_BEHAVIOR')
-        if os.getenv('DB_TABLE_PREFIX'):
-            config.schema_config.table_prefix = os.getenv('DB_TABLE_PREFIX')
+        if env['DB_SCHEMA']:
+            config.schema_config.name = env['DB_SCHEMA']
+        if env['DB_TABLE_BEHAVIOR']:
+            config.schema_config.table_behavior = env['DB_TABLE_BEHAVIOR']
+        if env['DB_TABLE_PREFIX']:
+            config.schema_config.table_prefix = env['DB_TABLE_PREFIX']
         
         # Data insertion configuration
-        if os.getenv('DB_INSERT_MODE'):
-            config.data_insertion.mode = os.getenv('DB_INSERT_MODE')
-        if os.getenv('DB_BATCH_SIZE'):
-            config.data_insertion.batch_size = int(os.getenv('DB_BATCH_SIZE'))
+        if env['DB_INSERT_MODE']:
+            config.data_insertion.mode = env['DB_INSERT_MODE']
+        if env['DB_BATCH_SIZE']:
+            config.data_insertion.batch_size = int(env['DB_BATCH_SIZE'])
+        if env['DB_BULK_MODE']:
+            config.data_insertion.bulk_mode = env['DB_BULK_MODE']
         
+        config.validate_bulk_mode()
         return config
     
     def get_table_name(self, base_name: str) -> str:
         """Get full table name with prefix"""
-        return f"{self.schema.table_prefix}{base_name}"
\ No newline at end of file
+        return f"{self.schema_config.table_prefix}{base_name}"
+
+@lru_cache(maxsize=16)
+def _load_yaml_config(cls, file_path: str, mtime: float) -> DatabaseConfig:
+    """Parse a YAML config; mtime is part of the cache key so edits are picked up"""
+    with open(file_path, 'r') as f:
+        data = yaml.load(f, Loader=YamlLoader)
+    return cls(**data)
+
+
+@lru_cache(maxsize=1)
+def _load_env_config(cls, env: Tuple[Optional[str], ...]) -> DatabaseConfig:
+    """Build a config from environment values (ordered as ENV_VARS)"""
+    return cls._from_env_values(dict(zip(ENV_VARS, env)))
@@ -3,13 +3,29 @@ Advanced error handling and recovery mechanisms for PII generation
 """
 
 import logging
+import sys
 import traceback
 import time
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, Deque
+from collections import Counter, deque
+from itertools import count, islice
 from dataclasses import dataclass
 from enum import Enum
 import json
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard library JSON encoder
+    orjson = None
+
+# Configure logging once at import, unless the application already has
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
 class ErrorSeverity(Enum):
     LOW = "low"
     MEDIUM = "medium" 
@@ -23,7 +39,13 @@ class ErrorCategory(Enum):
     PERFORMANCE = "performance"
     SYSTEM = "system"
 
-@dataclass
+# Severities whose tracebacks are always kept (others only when debug logging is on)
+_TRACEBACK_SEVERITIES = frozenset({ErrorSeverity.HIGH, ErrorSeverity.CRITICAL})
+
+# slots=True (no per-instance __dict__) needs Python 3.10+; setup.py still allows 3.8
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class ErrorContext:
     """Context information for errors"""
     error_id: str
@@ -37,9 +59,20 @@ class ErrorContext:
     recovery_successful: bool = False
     retry_count: int = 0
 
+def _dumps_error(entry: Dict[str, Any]) -> bytes:
+    """Serialize one exported error entry to compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(entry, default=str)
+    return json.dumps(entry, separators=(",", ":"), default=str).encode("utf-8")
+
 class RecoveryStrategy:
     """Base class for error recovery strategies"""
     
+    # Error categories this strategy may handle (can_recover can narrow further)
+    HANDLED_CATEGORIES: frozenset = frozenset()
+    # Whether recover() takes the failed function and its arguments
+    needs_func: bool = False
+    
     def can_recover(self, error_context: ErrorContext) -> bool:
         """Check if this strategy can handle the error"""
         raise NotImplementedError
@@ -51,20 +84,25 @@ class RecoveryStrategy:
 class RetryStrategy(RecoveryStrategy):
     """Retry strategy for transient errors"""
     
+    HANDLED_CATEGORIES = frozenset({ErrorCategory.GENERATION, ErrorCategory.SYSTEM})
+    needs_func = True
+    
     def __init__(self, max_retries: int = 3, backoff_multiplier: float = 1.5):
         self.max_retries = max_retries
         self.backoff_multiplier = backoff_multiplier
+        # Backoff wait for each retry count (can_recover caps it at max_retries)
+        self._waits = tuple(backoff_multiplier ** i for i in range(max_retries + 1))
     
     def can_recover(self, error_context: ErrorContext) -> bool:
         return (error_context.retry_count < self.max_retries and 
-                error_context.category in [ErrorCategory.GENERATION, ErrorCategory.SYSTEM])
+                error_context.category in self.HANDLED_CATEGORIES)
     
     def recover(self, error_context: ErrorContext, func: Callable, *args, **kwargs) -> bool:
         """Retry the failed operation with exponential backoff"""
         if not self.can_recover(error_context):
             return False
         
-        wait_time = (self.backoff_multiplier ** error_context.retry_count)
+        wait_time = self._waits[error_context.retry_count]
         time.sleep(wait_time)
         
         try:
@@ -79,60 +117,70 @@ class RetryStrategy(RecoveryStrategy):
 class ValidationRecoveryStrategy(RecoveryStrategy):
     """Recovery strategy for validation errors"""
     
+    HANDLED_CATEGORIES = frozenset({ErrorCategory.VALIDATION})
+    
     def can_recover(self, error_context: ErrorContext) -> bool:
-        return error_context.category == ErrorCategory.VALIDATION
+        return error_context.category in self.HANDLED_CATEGORIES
     
     def recover(self, error_context: ErrorContext, fallback_data: Dict[str, Any]) -> bool:
         """Use fallback data for validation errors"""
-        try:
-            # Apply default values for missing or invalid fields
-            if error_context.context_data:
-                error_context.context_data.update(fallback_data)
-            error_context.recovery_successful = True
-            return True
-        except Exception:
-            return False
+        # Apply default values for missing or invalid fields (a bad fallback_data
+        # raises into _attempt_recovery, which logs it and tries the next strategy)
+        ctx = error_context.context_data
+        if ctx:
+            ctx.update(fallback_data)
+        error_context.recovery_successful = True
+        return True
 
 class PerformanceRecoveryStrategy(RecoveryStrategy):
     """Recovery strategy for performance issues"""
     
+    HANDLED_CATEGORIES = frozenset({ErrorCategory.PERFORMANCE})
+    
     def can_recover(self, error_context: ErrorContext) -> bool:
-        return error_context.category == ErrorCategory.PERFORMANCE
+        return error_context.category in self.HANDLED_CATEGORIES
     
     def recover(self, error_context: ErrorContext, reduce_batch_size: bool = True) -> bool:
         """Reduce workload to address performance issues"""
         try:
-            if reduce_batch_size and error_context.context_data:
-                current_batch_size = error_context.context_data.get('batch_size', 1000)
-                new_batch_size = max(10, current_batch_size // 2)
-                error_context.context_data['batch_size'] = new_batch_size
+            ctx = error_context.context_data
+            if reduce_batch_size and ctx:
+                # Only shrink the settings the caller reported
+                batch_size = ctx.get('batch_size')
+                if batch_size is not None:
+                    ctx['batch_size'] = max(10, batch_size >> 1)
                 
-                current_threads = error_context.context_data.get('num_threads', 4)
-                new_threads = max(1, current_threads - 1)
-                error_context.context_data['num_threads'] = new_threads
+                num_threads = ctx.get('num_threads')
+                if num_threads is not None:
+                    ctx['num_threads'] = max(1, num_threads - 1)
             
             error_context.recovery_successful = True
             return True
-        except Exception:
+        except (KeyError, TypeError):
             return False
 
 class RobustErrorHandler:
     """Advanced error handling system with recovery mechanisms"""
     
     def __init__(self):
-        self.error_log: List[ErrorContext] = []
+        # Most recent errors only; the counters below cover everything still in the log
+        self.error_log: Deque[ErrorContext] = deque(maxlen=10000)
+        self._severity_counts: Counter = Counter()
+        self._category_counts: Counter = Counter()
+        self._recovered = 0
+        # Sequence numbers for error ids (the error time is in ErrorContext.timestamp)
+        self._error_ids = count()
         self.recovery_strategies: List[RecoveryStrategy] = [
             RetryStrategy(),
             ValidationRecoveryStrategy(),
             PerformanceRecoveryStrategy()
         ]
+        # Strategies per category, in recovery_strategies order
+        self._by_category: Dict[ErrorCategory, List[RecoveryStrategy]] = {
+            category: [s for s in self.recovery_strategies if category in s.HANDLED_CATEGORIES]
+            for category in ErrorCategory
+        }
         self.logger = logging.getLogger(__name__)
-        
-        # Configure logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
     
     def handle_error(self, 
                     exception: Exception,
@@ -148,16 +196,27 @@ class RobustErrorHandler:
             recovery_kwargs = {}
         
         error_context = ErrorContext(
-            error_id=f"err_{int(time.time() * 1000)}_{len(self.error_log)}",
+            error_id="err_" + str(next(self._error_ids)),
             timestamp=time.time(),
             severity=severity,
             category=category,
             message=str(exception),
-            traceback=traceback.format_exc(),
+            traceback=(traceback.format_exc()
+                       if severity in _TRACEBACK_SEVERITIES or self.logger.isEnabledFor(logging.DEBUG)
+                       else None),
             context_data=context_data or {}
         )
         
+        if len(self.error_log) == self.error_log.maxlen:
+            # The append below evicts the oldest entry; drop it from the counts
+            evicted = self.error_log[0]
+            self._severity_counts[evicted.severity] -= 1
+            self._category_counts[evicted.category] -= 1
+            if evicted.recovery_successful:
+                self._recovered -= 1
         self.error_log.append(error_context)
+        self._severity_counts[severity] += 1
+        self._category_counts[category] += 1
         
         # Log the error
         self.logger.error(f"Error {error_context.error_id}: {error_context.message}")
@@ -165,6 +224,8 @@ class RobustErrorHandler:
         # Attempt recovery
         if recovery_func:
             self._attempt_recovery(error_context, recovery_func, recovery_args, recovery_kwargs)
+            if error_context.recovery_successful:
+                self._recovered += 1
         
         return error_context
     
@@ -175,12 +236,12 @@ class RobustErrorHandler:
                          recovery_kwargs: dict) -> bool:
         """Attempt recovery using available strategies"""
         
-        for strategy in self.recovery_strategies:
+        for strategy in self._by_category[error_context.category]:
             if strategy.can_recover(error_context):
                 error_context.recovery_attempted = True
                 
                 try:
-                    if isinstance(strategy, RetryStrategy):
+                    if strategy.needs_func:
                         success = strategy.recover(error_context, recovery_func, *recovery_args, **recovery_kwargs)
                     else:
                         success = strategy.recover(error_context, **recovery_kwargs)
@@ -208,24 +269,17 @@ class RobustErrorHandler:
             "recent_errors": []
         }
         
-        recovered_count = 0
-        for error in self.error_log:
-            # Count by severity
-            severity_key = error.severity.value
-            summary["by_severity"][severity_key] = summary["by_severity"].get(severity_key, 0) + 1
-            
-            # Count by category
-            category_key = error.category.value
-            summary["by_category"][category_key] = summary["by_category"].get(category_key, 0) + 1
-            
-            # Count recoveries
-            if error.recovery_successful:
-                recovered_count += 1
-        
-        summary["recovery_rate"] = recovered_count / len(self.error_log) * 100
+        # Counts are kept up to date by handle_error
+        summary["by_severity"] = {
+            severity.value: count for severity, count in self._severity_counts.items() if count
+        }
+        summary["by_category"] = {
+            category.value: count for category, count in self._category_counts.items() if count
+        }
+        summary["recovery_rate"] = self._recovered / len(self.error_log) * 100
         
         # Recent errors (last 10)
-        recent_errors = self.error_log[-10:] if len(self.error_log) > 10 else self.error_log
+        recent_errors = list(islice(reversed(self.error_log), 10))[::-1]
         summary["recent_errors"] = [
             {
                 "error_id": error.error_id,
@@ -243,29 +297,29 @@ class RobustErrorHandler:
     def clear_error_log(self):
         """Clear the error log"""
         self.error_log.clear()
+        self._severity_counts.clear()
+        self._category_counts.clear()
+        self._recovered = 0
         self.logger.info("Error log cleared")
     
     def export_error_log(self, filename: str):
-        """Export error log to JSON file"""
+        """Export error log to a JSON Lines file (one error object per line)"""
         try:
-            error_data = []
-            for error in self.error_log:
-                error_dict = {
-                    "error_id": error.error_id,
-                    "timestamp": error.timestamp,
-                    "severity": error.severity.value,
-                    "category": error.category.value,
-                    "message": error.message,
-                    "traceback": error.traceback,
-                    "context_data": error.context_data,
-                    "recovery_attempted": error.recovery_attempted,
-                    "recovery_successful": error.recovery_successful,
-                    "retry_count": error.retry_count
-                }
-                error_data.append(error_dict)
-            
-            with open(filename, 'w') as f:
-                json.dump(error_data, f, indent=2)
+            with open(filename, 'wb') as f:
+                for error in self.error_log:
+                    f.write(_dumps_error({
+                        "error_id": error.error_id,
+                        "timestamp": error.timestamp,
+                        "severity": error.severity.value,
+                        "category": error.category.value,
+                        "message": error.message,
+                        "traceback": error.traceback,
+                        "context_data": error.context_data,
+                        "recovery_attempted": error.recovery_attempted,
+                        "recovery_successful": error.recovery_successful,
+                        "retry_count": error.retry_count
+                    }))
+                    f.write(b"\n")
             
             self.logger.info(f"Error log exported to {filename}")
         except Exception as e:
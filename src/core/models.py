@@ -1,11 +1,14 @@
 from datetime import datetime, date
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, TYPE_CHECKING
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 from enum import Enum
-import uuid
+import time
 
-# Import new data types - changed from TYPE_CHECKING to direct imports
-try:
+from src.core.uuid_pool import next_uuid_str
+
+if TYPE_CHECKING:
+    # Person's profile types; imported when the model is first built (see
+    # rebuild_person_model) so importing this module stays light
     from src.generators.medical_generator import MedicalProfile
     from src.generators.vehicle_generator import VehicleProfile
     from src.generators.education_generator import EducationProfile
@@ -15,17 +18,6 @@ try:
     from src.generators.travel_generator import TravelProfile
     from src.generators.financial_transactions_generator import FinancialProfile as EnhancedFinancialProfile
     from src.generators.communication_generator import CommunicationProfile
-except ImportError:
-    # Fallback for when modules aren't available yet
-    MedicalProfile = None
-    VehicleProfile = None
-    EducationProfile = None
-    OnlinePresence = None
-    PhysicalProfile = None
-    LifestyleProfile = None
-    TravelProfile = None
-    EnhancedFinancialProfile = None
-    CommunicationProfile = None
 
 
 class Gender(str, Enum):
@@ -60,8 +52,56 @@ class DataQualityProfile(BaseModel):
     inconsistency_rate: float = Field(default=0.03, ge=0.0, le=1.0)
 
 
+# Last datetime.now() handed out by _coarse_now and when (monotonic ns) it was read
+_now_cache = (0, None)
+
+
+def _coarse_now() -> datetime:
+    """datetime.now() at millisecond granularity, reusing one object within each millisecond"""
+    global _now_cache
+    read_ns, now = _now_cache
+    current_ns = time.monotonic_ns()
+    if now is None or current_ns - read_ns > 1_000_000:
+        now = datetime.now()
+        _now_cache = (current_ns, now)
+    return now
+
+
+# Named data quality profiles (CLI --variability-profile, web UI), built once at import
+VARIABILITY_PROFILES = {
+    'minimal': DataQualityProfile(
+        missing_data_rate=0.01,
+        typo_rate=0.005,
+        duplicate_rate=0.0001,
+        outlier_rate=0.001,
+        inconsistency_rate=0.01
+    ),
+    'realistic': DataQualityProfile(
+        missing_data_rate=0.05,
+        typo_rate=0.02,
+        duplicate_rate=0.001,
+        outlier_rate=0.01,
+        inconsistency_rate=0.03
+    ),
+    'messy': DataQualityProfile(
+        missing_data_rate=0.15,
+        typo_rate=0.05,
+        duplicate_rate=0.005,
+        outlier_rate=0.03,
+        inconsistency_rate=0.08
+    ),
+    'extreme': DataQualityProfile(
+        missing_data_rate=0.25,
+        typo_rate=0.10,
+        duplicate_rate=0.01,
+        outlier_rate=0.05,
+        inconsistency_rate=0.15
+    )
+}
+
+
 class Address(BaseModel):
-    address_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    address_id: str = Field(default_factory=next_uuid_str)
     address_type: AddressType
     street_1: str
     street_2: Optional[str] = None
@@ -77,7 +117,7 @@ class Address(BaseModel):
 
 
 class PhoneNumber(BaseModel):
-    phone_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    phone_id: str = Field(default_factory=next_uuid_str)
     phone_type: str  # mobile, home, work, fax
     country_code: str = "+1"
     area_code: str
@@ -89,7 +129,7 @@ class PhoneNumber(BaseModel):
 
 
 class EmailAddress(BaseModel):
-    email_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    email_id: str = Field(default_factory=next_uuid_str)
     email: str
     email_type: str  # personal, work, other
     is_primary: bool = False
@@ -100,13 +140,13 @@ class EmailAddress(BaseModel):
     @field_validator('domain', mode='before')
     @classmethod
     def extract_domain(cls, v, info):
-        if info.data.get('email') and '@' in info.data['email']:
-            return info.data['email'].split('@')[1]
-        return v
+        # Text after the last '@'; without one, keep the domain the caller supplied
+        _, at, domain = (info.data.get('email') or '').rpartition('@')
+        return domain if at else v
 
 
 class Employment(BaseModel):
-    employment_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    employment_id: str = Field(default_factory=next_uuid_str)
     employer_name: str
     job_title: str
     department: Optional[str] = None
@@ -133,7 +173,7 @@ class FinancialProfile(BaseModel):
 
 
 class Person(BaseModel):
-    person_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    person_id: str = Field(default_factory=next_uuid_str)
     ssn: Optional[str] = None
     first_name: str
     middle_name: Optional[str] = None
@@ -164,18 +204,88 @@ class Person(BaseModel):
     enhanced_financial_profile: Optional['EnhancedFinancialProfile'] = Field(default=None)
     communication_profile: Optional['CommunicationProfile'] = Field(default=None)
     
-    created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    # Current/primary entries of the lists above, cached at construction so
+    # exporters don't rescan the lists for every record (excluded from dumps)
+    current_address: Optional[Address] = Field(default=None, exclude=True, repr=False)
+    primary_phone: Optional[PhoneNumber] = Field(default=None, exclude=True, repr=False)
+    primary_email: Optional[EmailAddress] = Field(default=None, exclude=True, repr=False)
+    current_job: Optional[Employment] = Field(default=None, exclude=True, repr=False)
+    
+    created_at: datetime = Field(default_factory=_coarse_now)
+    updated_at: datetime = Field(default_factory=_coarse_now)
     
     model_config = ConfigDict(use_enum_values=True)
+    
+    def __init__(self, **data: Any) -> None:
+        # The profile types are resolved on first construction rather than at import
+        if not Person.__pydantic_complete__:
+            rebuild_person_model()
+        super().__init__(**data)
+    
+    # Class-level entry points resolve the profile types too, so they work
+    # before the first Person has been constructed
+    @classmethod
+    def model_validate(cls, *args: Any, **kwargs: Any) -> 'Person':
+        rebuild_person_model()
+        return super().model_validate(*args, **kwargs)
+    
+    @classmethod
+    def model_validate_json(cls, *args: Any, **kwargs: Any) -> 'Person':
+        rebuild_person_model()
+        return super().model_validate_json(*args, **kwargs)
+    
+    @classmethod
+    def model_validate_strings(cls, *args: Any, **kwargs: Any) -> 'Person':
+        rebuild_person_model()
+        return super().model_validate_strings(*args, **kwargs)
+    
+    @classmethod
+    def model_json_schema(cls, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        rebuild_person_model()
+        return super().model_json_schema(*args, **kwargs)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Fill in the cached primary entries the caller did not supply"""
+        if self.current_address is None and self.addresses:
+            self.current_address = next((a for a in self.addresses if a.address_type == "current"), None)
+        if self.primary_phone is None and self.phone_numbers:
+            self.primary_phone = next((p for p in self.phone_numbers if p.is_primary), None)
+        if self.primary_email is None and self.email_addresses:
+            self.primary_email = next((e for e in self.email_addresses if e.is_primary), None)
+        if self.current_job is None and self.employment_history:
+            self.current_job = next((e for e in self.employment_history if e.is_current), None)
 
 
 # Rebuild the model after all imports are complete
+def _profile_types() -> Dict[str, Any]:
+    """Import the generator modules that define Person's profile types"""
+    from src.generators.medical_generator import MedicalProfile
+    from src.generators.vehicle_generator import VehicleProfile
+    from src.generators.education_generator import EducationProfile
+    from src.generators.social_generator import OnlinePresence
+    from src.generators.biometric_generator import PhysicalProfile
+    from src.generators.lifestyle_generator import LifestyleProfile
+    from src.generators.travel_generator import TravelProfile
+    from src.generators.financial_transactions_generator import FinancialProfile as EnhancedFinancialProfile
+    from src.generators.communication_generator import CommunicationProfile
+    
+    return {
+        'MedicalProfile': MedicalProfile,
+        'VehicleProfile': VehicleProfile,
+        'EducationProfile': EducationProfile,
+        'OnlinePresence': OnlinePresence,
+        'PhysicalProfile': PhysicalProfile,
+        'LifestyleProfile': LifestyleProfile,
+        'TravelProfile': TravelProfile,
+        'EnhancedFinancialProfile': EnhancedFinancialProfile,
+        'CommunicationProfile': CommunicationProfile,
+    }
+
+
 def rebuild_person_model():
-    """Rebuild Person model after all forward references are resolved"""
-    # NOTE: Model rebuild is causing Pydantic validation issues
-    # The forward references resolve naturally, so we skip the rebuild
-    print("✅ Person model using natural forward reference resolution")
+    """Resolve Person's profile forward references (imports the profile modules once)"""
+    if not Person.__pydantic_complete__:
+        Person.model_rebuild(_types_namespace=_profile_types())
     return True
 
 class GenerationConfig(BaseModel):
@@ -201,4 +311,4 @@ class GenerationConfig(BaseModel):
     max_jobs_per_person: int = Field(default=5, ge=0)
     
     geographic_distribution: Dict[str, float] = Field(default_factory=dict)
-    industry_distribution: Dict[str, float] = Field(default_factory=dict)
\ No newline at end of file
+    industry_distribution: Dict[str, float] = Field(default_factory=dict)
@@ -1,18 +1,151 @@
 import multiprocessing as mp
 from multiprocessing import Pool, Queue, Process
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
 import threading
-from typing import Iterator, List, Callable, Any, Optional, Tuple
+import gc
+import operator
+import os
+from typing import Iterator, List, Callable, Any, Optional, Tuple, TYPE_CHECKING
+import sys
 import time
 import psutil
 import queue
+import random
 from datetime import datetime
 import logging
 from tqdm import tqdm
-import pandas as pd
 from contextlib import contextmanager
 
 from .models import Person, GenerationConfig
 
+if TYPE_CHECKING:
+    # pandas/pyarrow are only needed by the chunked generators; importing them adds ~0.4s to startup
+    import pandas as pd
+    import pyarrow as pa
+
+
+# Flattened person columns produced by generate_chunked
+_BASE_FIELDS = (
+    'person_id', 'ssn', 'first_name', 'middle_name', 'last_name', 'suffix',
+    'prefix', 'nickname', 'maiden_name', 'date_of_birth', 'gender',
+    'created_at', 'updated_at',
+)
+_base_values = operator.attrgetter(*_BASE_FIELDS)
+PERSON_FRAME_FIELDS = _BASE_FIELDS + (
+    'current_street_1', 'current_street_2', 'current_city', 'current_state', 'current_zip',
+    'primary_phone', 'primary_email',
+    'current_employer', 'current_job_title', 'current_salary',
+    'credit_score', 'annual_income', 'debt_to_income_ratio',
+)
+# Columns filled into typed numpy buffers rather than object lists; numeric
+# buffers start as NaN, so a missing value needs no write
+_TYPED_FIELDS = {
+    'date_of_birth': 'datetime64[D]',
+    'created_at': 'datetime64[us]',
+    'updated_at': 'datetime64[us]',
+    'current_salary': 'float64',
+    'credit_score': 'float64',
+    'annual_income': 'float64',
+    'debt_to_income_ratio': 'float64',
+}
+
+
+def person_arrow_schema() -> 'pa.Schema':
+    """Arrow schema of the batches yielded by generate_chunked_arrow"""
+    import pyarrow as pa
+    
+    types = {
+        'date_of_birth': pa.date32(),
+        'created_at': pa.timestamp('us'),
+        'updated_at': pa.timestamp('us'),
+        'current_salary': pa.float64(),
+        'credit_score': pa.int64(),
+        'annual_income': pa.float64(),
+        'debt_to_income_ratio': pa.float64(),
+    }
+    return pa.schema([(name, types.get(name, pa.string())) for name in PERSON_FRAME_FIELDS])
+
+
+# Minimum age of a cached RSS reading before memory checks re-read it
+MEMORY_SAMPLE_INTERVAL_NS = 250_000_000
+
+
+# gen0 GC threshold for processes dedicated to bulk generation. Generating a person
+# allocates thousands of short-lived objects, and at the default threshold (700)
+# the collector keeps running full collections that rescan every person kept so far
+GENERATION_GC_THRESHOLD = 50000
+
+
+def tune_gc_for_generation():
+    """Raise the gen0 collection threshold for the rest of this process"""
+    gc.set_threshold(GENERATION_GC_THRESHOLD, *gc.get_threshold()[1:])
+
+
+# Per-worker state (generator, seeding policy) set up once by _init_worker;
+# thread-local so it works for both process and thread pools
+_worker_state = threading.local()
+
+
+def _init_worker(config: GenerationConfig, reseed_batches: bool = True):
+    """Pool initializer: build the PersonGenerator this worker reuses for every batch"""
+    # Import here to avoid pickling issues
+    from ..generators.person_generator import PersonGenerator
+    
+    _worker_state.generator = PersonGenerator(config)
+    _worker_state.reseed_batches = reseed_batches
+    
+    if mp.parent_process() is not None:
+        # Worker processes only generate; thread workers share the caller's process
+        tune_gc_for_generation()
+
+
+def available_cpu_count() -> int:
+    """CPUs this process may actually use
+    
+    mp.cpu_count() reports every CPU on the host, even inside a container
+    restricted by CPU affinity or a cgroup v2 CPU quota.
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        count = len(os.sched_getaffinity(0))
+    else:
+        count = mp.cpu_count()
+    
+    # cgroup v2 quota: "<quota> <period>", or "max <period>" when unlimited
+    try:
+        with open('/sys/fs/cgroup/cpu.max') as f:
+            quota, period = f.read().split()[:2]
+        if quota != 'max':
+            count = min(count, max(1, int(quota) // int(period)))
+    except (OSError, ValueError):
+        pass
+    
+    return count
+
+
+def _generate_batch(seed: Optional[int], start_idx: int, count: int, batch_idx: int) -> List[Person]:
+    """Generate one work item: exactly `count` people
+    
+    Module-level and given only plain arguments, so submitting it to a process
+    pool pickles four ints rather than the PerformanceOptimizer.
+    """
+    # Reuse this worker's generator; seeding per batch keeps output reproducible
+    # regardless of which worker picks the batch up
+    generator = _worker_state.generator
+    
+    if _worker_state.reseed_batches:
+        random.seed(seed + batch_idx if seed else None)
+    
+    return [generator.generate_person() for _ in range(count)]
+
+
+def _pool_context():
+    """Start method for worker processes: fork on Linux, so workers inherit the
+    already-imported modules and constant tables instead of re-importing them
+    (other platforms keep their default, fork is unsafe on macOS)"""
+    if sys.platform.startswith('linux'):
+        return mp.get_context('fork')
+    return mp.get_context()
+
 
 class PerformanceOptimizer:
     """High-performance data generation with multiprocessing and streaming"""
@@ -27,14 +160,34 @@ class PerformanceOptimizer:
         self.bytes_generated = 0
         
         # System resources
-        self.cpu_count = mp.cpu_count()
+        self.cpu_count = available_cpu_count()
         self.memory_limit = psutil.virtual_memory().total * 0.8  # Use max 80% of RAM
         
+        # Reading RSS goes through /proc, so reuse one process handle and the
+        # last reading for MEMORY_SAMPLE_INTERVAL_NS
+        self._proc = psutil.Process()
+        self._last_rss_mb = 0.0
+        self._last_mem_check_ns = None
+        
     def generate_parallel(self, generator_func: Callable, 
                          total_records: int,
                          batch_size: Optional[int] = None,
-                         num_processes: Optional[int] = None) -> Iterator[List[Person]]:
-        """Generate records in parallel using multiprocessing"""
+                         num_processes: Optional[int] = None,
+                         mode: str = 'process') -> Iterator[List[Person]]:
+        """Generate records in parallel
+        
+        mode='process' runs batches in worker processes (scales past the GIL);
+        mode='thread' runs them in a thread pool, which avoids process start-up,
+        pickling and per-worker memory but is not reproducible with a seed: the
+        generators draw from the random module's shared global state, which is
+        seeded once before the workers start and never reseeded by them (that
+        would reset the stream the other threads are drawing from), and how the
+        threads interleave their draws depends on scheduling. Generation is pure Python,
+        so threads only add CPU throughput on a free-threaded build (3.13t+);
+        with the GIL they help only when the caller's consumer does I/O.
+        """
+        if mode not in ('process', 'thread'):
+            raise ValueError(f"Invalid mode: {mode}")
         if batch_size is None:
             batch_size = self.config.batch_size
         if num_processes is None:
@@ -42,77 +195,128 @@ class PerformanceOptimizer:
         
         self.start_time = time.time()
         
-        # Calculate batches per process
-        records_per_process = total_records // num_processes
-        remainder = total_records % num_processes
+        # One work item per batch so every worker stays busy until the end
+        work_items = (
+            (start_idx, min(batch_size, total_records - start_idx), batch_idx)
+            for batch_idx, start_idx in enumerate(range(0, total_records, batch_size))
+        )
         
-        # Create work items
-        work_items = []
-        start_idx = 0
-        for i in range(num_processes):
-            count = records_per_process + (1 if i < remainder else 0)
-            if count > 0:
-                work_items.append((start_idx, count, batch_size, i))
-                start_idx += count
+        # Keep at most two batches per worker in flight so results are consumed
+        # (written/inserted) while the next ones are being generated
+        max_pending = 2 * num_processes
         
         # Progress tracking
-        with tqdm(total=total_records, desc="Generating records") as pbar:
-            with Pool(processes=num_processes) as pool:
-                # Use imap_unordered for better performance
-                results = pool.imap_unordered(
-                    self._generate_batch_wrapper,
-                    work_items,
-                    chunksize=1
-                )
+        # Progress is updated once per batch; mininterval caps the redraw rate
+        with tqdm(total=total_records, desc="Generating records",
+                  mininterval=0.2, smoothing=0.05) as pbar:
+            if mode == 'thread':
+                # Thread workers share the global random state: seed it once here,
+                # and keep their generators from reseeding it on construction
+                if self.config.seed:
+                    random.seed(self.config.seed)
+                executor = ThreadPoolExecutor(max_workers=num_processes,
+                                              initializer=_init_worker,
+                                              initargs=(self.config.model_copy(update={'seed': None}), False))
+            else:
+                executor = ProcessPoolExecutor(max_workers=num_processes,
+                                               mp_context=_pool_context(),
+                                               initializer=_init_worker,
+                                               initargs=(self.config,))
+            
+            with executor:
+                pending = set()
+                for work_item in work_items:
+                    pending.add(executor.submit(_generate_batch, self.config.seed, *work_item))
+                    if len(pending) < max_pending:
+                        continue
+                    
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        batch = future.result()
+                        self.records_generated += len(batch)
+                        pbar.update(len(batch))
+                        yield batch
                 
-                for batch in results:
-                    self.records_generated += len(batch)
-                    pbar.update(len(batch))
-                    yield batch
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        batch = future.result()
+                        self.records_generated += len(batch)
+                        pbar.update(len(batch))
+                        yield batch
         
         self._log_performance_stats()
     
     def stream_generate(self, generator_func: Callable,
                        rate_per_second: int,
-                       duration_seconds: Optional[int] = None) -> Iterator[Person]:
-        """Stream generation at specified rate"""
-        interval = 1.0 / rate_per_second
-        start_time = time.time()
+                       duration_seconds: Optional[int] = None,
+                       progress_callback: Optional[Callable[[int], None]] = None,
+                       progress_every: int = 100) -> Iterator[Person]:
+        """Stream generation at specified rate
         
-        while True:
-            if duration_seconds and (time.time() - start_time) > duration_seconds:
-                break
-            
-            batch_start = time.time()
-            
-            # Generate one record
-            record = generator_func()
-            self.records_generated += 1
-            yield record
-            
-            # Rate limiting
-            elapsed = time.time() - batch_start
-            if elapsed < interval:
-                time.sleep(interval - elapsed)
+        progress_callback(n) is called with the number of records streamed since
+        its previous call, every progress_every records and when the stream
+        ends, so a progress bar can be driven without a per-record update.
+        """
+        # Integer nanoseconds on the monotonic clock: immune to wall-clock jumps,
+        # and records are paced against a schedule so sleep overshoot doesn't
+        # accumulate into drift
+        interval_ns = 10**9 // rate_per_second
+        start_ns = time.monotonic_ns()
+        end_ns = start_ns + duration_seconds * 10**9 if duration_seconds else None
+        next_deadline = start_ns
+        unreported = 0
+        
+        try:
+            while True:
+                now_ns = time.monotonic_ns()
+                if end_ns is not None and now_ns > end_ns:
+                    break
+                
+                # Generate one record
+                record = generator_func()
+                self.records_generated += 1
+                
+                if progress_callback is not None:
+                    unreported += 1
+                    if unreported >= progress_every:
+                        progress_callback(unreported)
+                        unreported = 0
+                
+                yield record
+                
+                # Rate limiting. The schedule is clamped to now, so time lost while the
+                # consumer stalls or generator_func is slow isn't made up in a burst
+                now_ns = time.monotonic_ns()
+                next_deadline = max(next_deadline + interval_ns, now_ns)
+                wait_ns = next_deadline - now_ns
+                if wait_ns > 0:
+                    time.sleep(wait_ns / 1e9)
+        finally:
+            if unreported:
+                progress_callback(unreported)
     
     def generate_chunked(self, generator_func: Callable,
                         total_records: int,
-                        chunk_size: int = 10000) -> Iterator[pd.DataFrame]:
+                        chunk_size: int = 10000) -> Iterator['pd.DataFrame']:
         """Generate records in memory-efficient chunks as DataFrames"""
+        import numpy as np
+        import pandas as pd
+        
         remaining = total_records
         
         with tqdm(total=total_records, desc="Generating chunks") as pbar:
             while remaining > 0:
                 current_chunk_size = min(chunk_size, remaining)
-                chunk_data = []
+                cols = self._generate_chunk_columns(generator_func, current_chunk_size)
                 
-                for _ in range(current_chunk_size):
-                    record = generator_func()
-                    # Convert to dict for DataFrame
-                    chunk_data.append(self._person_to_dict(record))
+                # Credit scores are integers unless some person had no financial profile
+                credit_scores = cols['credit_score']
+                if not np.isnan(credit_scores).any():
+                    cols['credit_score'] = credit_scores.astype(np.int64)
                 
-                # Create DataFrame
-                df = pd.DataFrame(chunk_data)
+                # Typed columns are taken as-is, without dtype inference or a copy
+                df = pd.DataFrame(cols, copy=False)
                 
                 remaining -= current_chunk_size
                 self.records_generated += current_chunk_size
@@ -120,13 +324,46 @@ class PerformanceOptimizer:
                 
                 yield df
     
+    def generate_chunked_arrow(self, generator_func: Callable,
+                               total_records: int,
+                               chunk_size: int = 10000) -> Iterator['pa.RecordBatch']:
+        """Generate records in chunks as Arrow record batches
+        
+        Same columns as generate_chunked, but built straight into Arrow arrays
+        with a fixed schema, so batches can go to pq.ParquetWriter.write_batch()
+        (or an IPC writer) without passing through a DataFrame.
+        """
+        import pyarrow as pa
+        
+        schema = person_arrow_schema()
+        remaining = total_records
+        
+        with tqdm(total=total_records, desc="Generating chunks") as pbar:
+            while remaining > 0:
+                current_chunk_size = min(chunk_size, remaining)
+                cols = self._generate_chunk_columns(generator_func, current_chunk_size)
+                
+                # from_pandas turns the NaN placeholders in numeric buffers into nulls
+                batch = pa.RecordBatch.from_arrays(
+                    [pa.array(cols[field.name], from_pandas=True).cast(field.type)
+                     if field.name in _TYPED_FIELDS else pa.array(cols[field.name], type=field.type)
+                     for field in schema],
+                    schema=schema,
+                )
+                
+                remaining -= current_chunk_size
+                self.records_generated += current_chunk_size
+                pbar.update(current_chunk_size)
+                
+                yield batch
+    
     @contextmanager
     def memory_monitor(self, threshold_mb: int = 2000):
         """Monitor memory usage and yield control if threshold exceeded"""
-        initial_memory = psutil.Process().memory_info().rss / 1024 / 1024
+        initial_memory = self._rss_mb(fresh=True)
         
         def check_memory():
-            current_memory = psutil.Process().memory_info().rss / 1024 / 1024
+            current_memory = self._rss_mb()
             used_memory = current_memory - initial_memory
             
             if used_memory > threshold_mb:
@@ -136,91 +373,78 @@ class PerformanceOptimizer:
         
         yield check_memory
     
-    def _generate_batch_wrapper(self, args: Tuple[int, int, int, int]) -> List[Person]:
-        """Wrapper for multiprocessing batch generation"""
-        start_idx, count, batch_size, process_id = args
-        
-        # Re-seed random in each process
-        import random
-        random.seed(self.config.seed + process_id if self.config.seed else None)
+    def _rss_mb(self, fresh: bool = False) -> float:
+        """Resident memory of this process in MB, re-read at most every
+        MEMORY_SAMPLE_INTERVAL_NS unless fresh is set"""
+        now_ns = time.monotonic_ns()
+        if (fresh or self._last_mem_check_ns is None
+                or now_ns - self._last_mem_check_ns > MEMORY_SAMPLE_INTERVAL_NS):
+            self._last_rss_mb = self._proc.memory_info().rss / 1024 / 1024
+            self._last_mem_check_ns = now_ns
+        return self._last_rss_mb
+    
+    def _generate_chunk_columns(self, generator_func: Callable, size: int) -> dict:
+        """Generate `size` people into one preallocated column per field"""
+        import numpy as np
         
-        # Import here to avoid pickling issues
-        from ..generators.person_generator import PersonGenerator
+        # Columns instead of a dict per record; text fields a person lacks stay None
+        cols = {
+            name: (np.full(size, np.nan, dtype=_TYPED_FIELDS[name])
+                   if name in _TYPED_FIELDS else [None] * size)
+            for name in PERSON_FRAME_FIELDS
+        }
         
-        # Create generator for this process
-        generator = PersonGenerator(self.config)
+        # Base fields are read as one tuple per person and transposed at the end
+        base_rows = [None] * size
+        for i in range(size):
+            person = generator_func()
+            base_rows[i] = _base_values(person)
+            self._fill_person_columns(cols, i, person)
         
-        batch = []
-        for i in range(count):
-            person = generator.generate_person()
-            batch.append(person)
-            
-            # Yield batches to prevent memory buildup
-            if len(batch) >= batch_size:
-                yield_batch = batch
-                batch = []
-                return yield_batch
+        for name, column in zip(_BASE_FIELDS, zip(*base_rows)):
+            if name in _TYPED_FIELDS:
+                cols[name][:] = column
+            else:
+                cols[name] = list(column)
         
-        return batch
+        return cols
     
-    def _person_to_dict(self, person: Person) -> dict:
-        """Convert Person object to flat dictionary for DataFrame"""
-        # Base fields
-        data = {
-            'person_id': person.person_id,
-            'ssn': person.ssn,
-            'first_name': person.first_name,
-            'middle_name': person.middle_name,
-            'last_name': person.last_name,
-            'suffix': person.suffix,
-            'prefix': person.prefix,
-            'nickname': person.nickname,
-            'maiden_name': person.maiden_name,
-            'date_of_birth': person.date_of_birth,
-            'gender': person.gender,
-            'created_at': person.created_at,
-            'updated_at': person.updated_at
-        }
-        
+    @staticmethod
+    def _fill_person_columns(cols: dict, i: int, person: Person):
+        """Write one person's nested fields into row i of the chunk columns"""
         # Current address
-        current_addr = next((a for a in person.addresses if a.address_type == "current"), None)
-        if current_addr:
-            data.update({
-                'current_street_1': current_addr.street_1,
-                'current_street_2': current_addr.street_2,
-                'current_city': current_addr.city,
-                'current_state': current_addr.state,
-                'current_zip': current_addr.zip_code
-            })
+        current_addr = person.current_address
+        if current_addr is not None:
+            cols['current_street_1'][i] = current_addr.street_1
+            cols['current_street_2'][i] = current_addr.street_2
+            cols['current_city'][i] = current_addr.city
+            cols['current_state'][i] = current_addr.state
+            cols['current_zip'][i] = current_addr.zip_code
         
         # Primary phone
-        primary_phone = next((p for p in person.phone_numbers if p.is_primary), None)
-        if primary_phone:
-            data['primary_phone'] = f"{primary_phone.area_code}{primary_phone.number}"
+        primary_phone = person.primary_phone
+        if primary_phone is not None:
+            cols['primary_phone'][i] = primary_phone.area_code + primary_phone.number
         
         # Primary email
-        primary_email = next((e for e in person.email_addresses if e.is_primary), None)
-        if primary_email:
-            data['primary_email'] = primary_email.email
+        primary_email = person.primary_email
+        if primary_email is not None:
+            cols['primary_email'][i] = primary_email.email
         
         # Current employment
-        current_job = next((e for e in person.employment_history if e.is_current), None)
-        if current_job:
-            data.update({
-                'current_employer': current_job.employer_name,
-                'current_job_title': current_job.job_title,
-                'current_salary': current_job.salary
-            })
+        current_job = person.current_job
+        if current_job is not None:
+            cols['current_employer'][i] = current_job.employer_name
+            cols['current_job_title'][i] = current_job.job_title
+            if current_job.salary is not None:
+                cols['current_salary'][i] = current_job.salary
         
         # Financial profile
-        if person.financial_profile:
-            data.update({
-                'credit_score': person.financial_profile.credit_score,
-                'annual_income': person.financial_profile.annual_income,
-                'debt_to_income_ratio': person.financial_profile.debt_to_income_ratio
-            })
-        
-        return data
+        financial = person.financial_profile
+        if financial:
+            cols['credit_score'][i] = financial.credit_score
+            cols['annual_income'][i] = financial.annual_income
+            cols['debt_to_income_ratio'][i] = financial.debt_to_income_ratio
     
     def _log_performance_stats(self):
         """Log performance statistics"""
@@ -234,14 +458,32 @@ class PerformanceOptimizer:
         self.logger.info(f"  Total records: {self.records_generated:,}")
         self.logger.info(f"  Time elapsed: {elapsed:.2f} seconds")
         self.logger.info(f"  Rate: {rate:.2f} records/second")
-        self.logger.info(f"  Memory used: {psutil.Process().memory_info().rss / 1024 / 1024:.2f} MB")
+        self.logger.info(f"  Memory used: {self._rss_mb(fresh=True):.2f} MB")
 
 
 class StreamingBuffer:
-    """Buffer for streaming data generation with backpressure"""
+    """Buffer for streaming data generation with backpressure
+    
+    The producer hands over whole batches, so the queue is locked once per
+    batch_size records rather than once per record; max_size still bounds
+    the number of records buffered. With max_bytes set, the producer also
+    waits while the buffered batches exceed that many bytes, as measured by
+    record_size (sys.getsizeof is shallow, so pass a deep estimate such as
+    len of a serialized record when records are nested objects).
+    """
     
-    def __init__(self, max_size: int = 10000):
-        self.queue = queue.Queue(maxsize=max_size)
+    # Put by the producer after its last batch
+    _DONE = object()
+    
+    def __init__(self, max_size: int = 10000, batch_size: int = 1000,
+                 max_bytes: Optional[int] = None,
+                 record_size: Callable[[Any], int] = sys.getsizeof):
+        self.batch_size = batch_size
+        self.queue = queue.Queue(maxsize=max(1, max_size // batch_size))
+        self.max_bytes = max_bytes
+        self.record_size = record_size
+        self._queued_bytes = 0
+        self._bytes_freed = threading.Condition()
         self.producer_thread = None
         self.stop_event = threading.Event()
         
@@ -255,39 +497,88 @@ class StreamingBuffer:
     
     def _produce(self, generator_func: Callable, count: int):
         """Producer thread function"""
-        for i in range(count):
-            if self.stop_event.is_set():
-                break
-            
-            record = generator_func()
-            self.queue.put(record)
+        try:
+            for start in range(0, count, self.batch_size):
+                if self.stop_event.is_set():
+                    break
+                
+                batch = [generator_func() for _ in range(min(self.batch_size, count - start))]
+                nbytes = 0
+                if self.max_bytes is not None:
+                    nbytes = sum(map(self.record_size, batch))
+                    with self._bytes_freed:
+                        # A batch always fits into an empty buffer, however large
+                        while (self._queued_bytes and self._queued_bytes + nbytes > self.max_bytes
+                               and not self.stop_event.is_set()):
+                            self._bytes_freed.wait(timeout=0.1)
+                        self._queued_bytes += nbytes
+                self.queue.put((batch, nbytes))
+        finally:
+            self.queue.put(self._DONE)
     
-    def consume(self, batch_size: int = 1000) -> Iterator[List[Any]]:
-        """Consume records in batches"""
-        batch = []
+    def _release(self, nbytes: int):
+        """Account for a batch leaving the buffer"""
+        if nbytes:
+            with self._bytes_freed:
+                self._queued_bytes -= nbytes
+                self._bytes_freed.notify()
+    
+    def consume(self, batch_size: Optional[int] = None) -> Iterator[List[Any]]:
+        """Consume records in batches
+        
+        Batches are yielded as the producer built them (the buffer's batch_size
+        records, the last may be shorter); pass batch_size to re-chunk them into
+        batches of that many records instead.
+        """
+        if batch_size is None or batch_size == self.batch_size:
+            yield from self._consume_batches()
+            return
         
+        pending = []
+        for batch in self._consume_batches():
+            pending.extend(batch)
+            if len(pending) >= batch_size:
+                full = len(pending) - len(pending) % batch_size
+                for start in range(0, full, batch_size):
+                    yield pending[start:start + batch_size]
+                pending = pending[full:]
+        if pending:
+            yield pending
+    
+    def _consume_batches(self) -> Iterator[List[Any]]:
+        """Yield the producer's batches until it is done"""
         while True:
             try:
-                # Get with timeout to check stop event
-                record = self.queue.get(timeout=1.0)
-                batch.append(record)
-                
-                if len(batch) >= batch_size:
-                    yield batch
-                    batch = []
-                    
+                # Get with timeout so a dead producer can't block us forever
+                item = self.queue.get(timeout=1.0)
             except queue.Empty:
-                # Check if producer is done
                 if self.producer_thread and not self.producer_thread.is_alive():
-                    if batch:
-                        yield batch
                     break
+                continue
+            
+            if item is self._DONE:
+                break
+            batch, nbytes = item
+            self._release(nbytes)
+            yield batch
     
     def stop(self):
         """Stop producer"""
         self.stop_event.set()
         if self.producer_thread:
-            self.producer_thread.join()
+            # Discard buffered batches so a producer blocked on a full queue can finish
+            while True:
+                alive = self.producer_thread.is_alive()
+                try:
+                    while True:
+                        item = self.queue.get_nowait()
+                        if item is not self._DONE:
+                            self._release(item[1])
+                except queue.Empty:
+                    pass
+                if not alive:
+                    break
+                self.producer_thread.join(timeout=0.1)
 
 
 def estimate_memory_usage(num_records: int, avg_record_size: int = 2048) -> float:
@@ -4,12 +4,18 @@ Real-time progress tracking system with WebSocket support
 
 import time
 import threading
-from typing import Dict, Any, Optional, Callable
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional, Callable, Tuple
+from dataclasses import dataclass
 from enum import Enum
 import json
 import uuid
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to the standard library JSON encoder
+    orjson = None
+
 class TaskStatus(Enum):
     PENDING = "pending"
     RUNNING = "running"
@@ -37,6 +43,22 @@ class ProgressUpdate:
     rate_per_second: Optional[float] = None
     error_message: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
+    
+    def to_payload(self) -> Dict[str, Any]:
+        """JSON-ready dict of this update
+        
+        Only metadata is copied (one level); asdict() would deep-copy every field.
+        """
+        payload = dict(self.__dict__)
+        payload['task_type'] = self.task_type.value
+        payload['status'] = self.status.value
+        if self.metadata is not None:
+            payload['metadata'] = dict(self.metadata)
+        return payload
+
+# Minimum gap between progress updates passed to callbacks for one task
+# (~20 per second, as much as a UI can usefully render)
+NOTIFY_INTERVAL_NS = 50_000_000
 
 class ProgressTracker:
     """Advanced progress tracking with real-time updates"""
@@ -44,7 +66,15 @@ class ProgressTracker:
     def __init__(self):
         self.tasks: Dict[str, ProgressUpdate] = {}
         self.callbacks: List[Callable[[ProgressUpdate], None]] = []
+        # Guards adding/removing tasks; each task's fields are guarded by its own
+        # lock so updates to different tasks don't contend
         self.lock = threading.Lock()
+        self._locks: Dict[str, threading.Lock] = {}
+        # Monotonic start time per running task, for elapsed/rate figures
+        # (metadata keeps the wall-clock timestamps reported to clients)
+        self._started_ns: Dict[str, int] = {}
+        # (time, whole percent) of the last update each task passed to callbacks
+        self._last_notify: Dict[str, Tuple[int, int]] = {}
     
     def create_task(self, 
                    task_type: TaskType, 
@@ -53,33 +83,43 @@ class ProgressTracker:
         """Create a new task and return its ID"""
         task_id = str(uuid.uuid4())
         
+        task = ProgressUpdate(
+            task_id=task_id,
+            task_type=task_type,
+            status=TaskStatus.PENDING,
+            progress_percent=0.0,
+            current_step=description or "Initializing",
+            current_count=0,
+            total_count=total_count,
+            elapsed_time=0.0,
+            metadata={"created_at": time.time()}
+        )
         with self.lock:
-            self.tasks[task_id] = ProgressUpdate(
-                task_id=task_id,
-                task_type=task_type,
-                status=TaskStatus.PENDING,
-                progress_percent=0.0,
-                current_step=description or "Initializing",
-                current_count=0,
-                total_count=total_count,
-                elapsed_time=0.0,
-                metadata={"created_at": time.time()}
-            )
+            self._locks[task_id] = threading.Lock()
+            self.tasks[task_id] = task
         
-        self._notify_callbacks(self.tasks[task_id])
+        self._notify_callbacks(task)
         return task_id
     
+    def _task_and_lock(self, task_id: str):
+        """Look up a task and its lock, (None, None) if it doesn't exist"""
+        with self.lock:
+            return self.tasks.get(task_id), self._locks.get(task_id)
+    
     def start_task(self, task_id: str, description: str = "Starting"):
         """Mark task as started"""
-        with self.lock:
-            if task_id in self.tasks:
-                task = self.tasks[task_id]
-                task.status = TaskStatus.RUNNING
-                task.current_step = description
-                task.metadata = task.metadata or {}
-                task.metadata["started_at"] = time.time()
+        task, task_lock = self._task_and_lock(task_id)
+        if task is None:
+            return
+        
+        with task_lock:
+            task.status = TaskStatus.RUNNING
+            task.current_step = description
+            task.metadata = task.metadata or {}
+            task.metadata["started_at"] = time.time()
+            self._started_ns[task_id] = time.monotonic_ns()
         
-        self._notify_callbacks(self.tasks[task_id])
+        self._notify_callbacks(task)
     
     def update_progress(self, 
                        task_id: str, 
@@ -87,11 +127,11 @@ class ProgressTracker:
                        step_description: str = None,
                        metadata: Dict[str, Any] = None):
         """Update task progress"""
-        with self.lock:
-            if task_id not in self.tasks:
-                return
-            
-            task = self.tasks[task_id]
+        task, task_lock = self._task_and_lock(task_id)
+        if task is None:
+            return
+        
+        with task_lock:
             task.current_count = current_count
             task.progress_percent = (current_count / task.total_count) * 100
             
@@ -99,9 +139,9 @@ class ProgressTracker:
                 task.current_step = step_description
             
             # Calculate timing metrics
-            current_time = time.time()
-            start_time = task.metadata.get("started_at", current_time)
-            task.elapsed_time = current_time - start_time
+            started_ns = self._started_ns.get(task_id)
+            if started_ns is not None:
+                task.elapsed_time = (time.monotonic_ns() - started_ns) / 1e9
             
             if task.elapsed_time > 0 and current_count > 0:
                 task.rate_per_second = current_count / task.elapsed_time
@@ -114,59 +154,77 @@ class ProgressTracker:
             if metadata:
                 task.metadata = task.metadata or {}
                 task.metadata.update(metadata)
+            
+            # Coalesce: pass an update on only every NOTIFY_INTERVAL_NS or when the
+            # whole percent changes (status changes always notify)
+            now_ns = time.monotonic_ns()
+            percent = int(task.progress_percent)
+            last = self._last_notify.get(task_id)
+            if last is not None and now_ns - last[0] < NOTIFY_INTERVAL_NS and percent == last[1]:
+                return
+            self._last_notify[task_id] = (now_ns, percent)
         
-        self._notify_callbacks(self.tasks[task_id])
+        self._notify_callbacks(task)
     
     def complete_task(self, task_id: str, final_metadata: Dict[str, Any] = None):
         """Mark task as completed"""
-        with self.lock:
-            if task_id in self.tasks:
-                task = self.tasks[task_id]
-                task.status = TaskStatus.COMPLETED
-                task.progress_percent = 100.0
-                task.current_step = "Completed"
-                task.current_count = task.total_count
-                
-                current_time = time.time()
-                task.metadata = task.metadata or {}
-                task.metadata["completed_at"] = current_time
-                
-                if final_metadata:
-                    task.metadata.update(final_metadata)
+        task, task_lock = self._task_and_lock(task_id)
+        if task is None:
+            return
         
-        self._notify_callbacks(self.tasks[task_id])
+        with task_lock:
+            task.status = TaskStatus.COMPLETED
+            task.progress_percent = 100.0
+            task.current_step = "Completed"
+            task.current_count = task.total_count
+            
+            current_time = time.time()
+            task.metadata = task.metadata or {}
+            task.metadata["completed_at"] = current_time
+            self._started_ns.pop(task_id, None)
+            
+            if final_metadata:
+                task.metadata.update(final_metadata)
+        
+        self._notify_callbacks(task)
     
     def fail_task(self, task_id: str, error_message: str, metadata: Dict[str, Any] = None):
         """Mark task as failed"""
-        with self.lock:
-            if task_id in self.tasks:
-                task = self.tasks[task_id]
-                task.status = TaskStatus.FAILED
-                task.current_step = "Failed"
-                task.error_message = error_message
-                
-                current_time = time.time()
-                task.metadata = task.metadata or {}
-                task.metadata["failed_at"] = current_time
-                
-                if metadata:
-                    task.metadata.update(metadata)
+        task, task_lock = self._task_and_lock(task_id)
+        if task is None:
+            return
         
-        self._notify_callbacks(self.tasks[task_id])
+        with task_lock:
+            task.status = TaskStatus.FAILED
+            task.current_step = "Failed"
+            task.error_message = error_message
+            
+            current_time = time.time()
+            task.metadata = task.metadata or {}
+            task.metadata["failed_at"] = current_time
+            self._started_ns.pop(task_id, None)
+            
+            if metadata:
+                task.metadata.update(metadata)
+        
+        self._notify_callbacks(task)
     
     def cancel_task(self, task_id: str):
         """Cancel a running task"""
-        with self.lock:
-            if task_id in self.tasks:
-                task = self.tasks[task_id]
-                task.status = TaskStatus.CANCELLED
-                task.current_step = "Cancelled"
-                
-                current_time = time.time()
-                task.metadata = task.metadata or {}
-                task.metadata["cancelled_at"] = current_time
+        task, task_lock = self._task_and_lock(task_id)
+        if task is None:
+            return
+        
+        with task_lock:
+            task.status = TaskStatus.CANCELLED
+            task.current_step = "Cancelled"
+            
+            current_time = time.time()
+            task.metadata = task.metadata or {}
+            task.metadata["cancelled_at"] = current_time
+            self._started_ns.pop(task_id, None)
         
-        self._notify_callbacks(self.tasks[task_id])
+        self._notify_callbacks(task)
     
     def get_task(self, task_id: str) -> Optional[ProgressUpdate]:
         """Get task by ID"""
@@ -200,6 +258,8 @@ class ProgressTracker:
             
             for task_id in to_remove:
                 del self.tasks[task_id]
+                self._locks.pop(task_id, None)
+                self._last_notify.pop(task_id, None)
     
     def add_callback(self, callback: Callable[[ProgressUpdate], None]):
         """Add a callback for progress updates"""
@@ -219,54 +279,77 @@ class ProgressTracker:
                 # Log callback errors but don't let them break progress tracking
                 print(f"Progress callback error: {e}")
 
+class OrjsonSocketIOJson:
+    """json-module stand-in for SocketIO(json=...) that encodes with orjson
+    
+    Socket.IO packets must be text, so dumps() decodes orjson's bytes; the
+    stdlib keyword arguments Socket.IO passes (separators etc.) are ignored,
+    as orjson output is already compact.
+    """
+    
+    @staticmethod
+    def dumps(obj: Any, *args, **kwargs) -> str:
+        return orjson.dumps(obj, default=str).decode()
+    
+    @staticmethod
+    def loads(s, *args, **kwargs) -> Any:
+        return orjson.loads(s)
+
+
+def socketio_json_options() -> Dict[str, Any]:
+    """Extra SocketIO() keyword arguments: orjson encoding when it is installed"""
+    return {'json': OrjsonSocketIOJson} if orjson is not None else {}
+
+
 class WebSocketProgressNotifier:
-    """WebSocket notifier for progress updates"""
+    """WebSocket notifier for progress updates
+    
+    Subscribers of a task join its Socket.IO room, so an update is emitted
+    (and serialized) once per task rather than once per subscriber.
+    """
     
-    def __init__(self, socketio_instance):
+    def __init__(self, socketio_instance, namespace: str = '/'):
         self.socketio = socketio_instance
+        self.namespace = namespace
         self.active_clients: Dict[str, set] = {}  # task_id -> set of client session IDs
     
+    @staticmethod
+    def task_room(task_id: str) -> str:
+        """Socket.IO room of a task's subscribers"""
+        return f"task:{task_id}"
+    
     def subscribe_client(self, session_id: str, task_id: str):
         """Subscribe a client to task updates"""
         if task_id not in self.active_clients:
             self.active_clients[task_id] = set()
         self.active_clients[task_id].add(session_id)
+        self.socketio.server.enter_room(session_id, self.task_room(task_id), namespace=self.namespace)
     
     def unsubscribe_client(self, session_id: str, task_id: str = None):
         """Unsubscribe a client from task updates"""
-        if task_id:
-            if task_id in self.active_clients:
-                self.active_clients[task_id].discard(session_id)
-                if not self.active_clients[task_id]:
-                    del self.active_clients[task_id]
-        else:
-            # Remove from all tasks
-            for task_clients in self.active_clients.values():
-                task_clients.discard(session_id)
+        task_ids = [task_id] if task_id else list(self.active_clients)
+        for tid in task_ids:
+            clients = self.active_clients.get(tid)
+            if clients is None or session_id not in clients:
+                continue
+            clients.discard(session_id)
+            self.socketio.server.leave_room(session_id, self.task_room(tid), namespace=self.namespace)
             # Clean up empty task client sets
-            self.active_clients = {
-                task_id: clients for task_id, clients in self.active_clients.items()
-                if clients
-            }
+            if not clients:
+                del self.active_clients[tid]
     
     def notify_progress(self, progress: ProgressUpdate):
         """Send progress update to subscribed clients"""
         task_id = progress.task_id
         
+        # Convert progress to dict for JSON serialization (once for every room)
+        progress_dict = progress.to_payload()
+        
         if task_id in self.active_clients:
-            # Convert progress to dict for JSON serialization
-            progress_dict = asdict(progress)
-            progress_dict['task_type'] = progress.task_type.value
-            progress_dict['status'] = progress.status.value
-            
-            # Send to all subscribed clients
-            for client_session in self.active_clients[task_id]:
-                self.socketio.emit('progress_update', progress_dict, room=client_session)
+            # One emit reaches every subscriber of the task
+            self.socketio.emit('progress_update', progress_dict, room=self.task_room(task_id))
         
         # Also broadcast to general progress room
-        progress_dict = asdict(progress)
-        progress_dict['task_type'] = progress.task_type.value
-        progress_dict['status'] = progress.status.value
         self.socketio.emit('progress_update', progress_dict, room='progress_updates')
 
 # Global progress tracker instance
@@ -0,0 +1,49 @@
+"""
+Batch sampling helpers - draw the random fields for many records in one vectorized call
+"""
+
+import random
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+class BatchSampler:
+    """Pre-draws every random field for a batch of records into dense columns
+
+    Fields are registered with choice()/integers()/uniform(), each drawing `size`
+    values in one numpy call; record i then reads its values with sampler[i].
+    The numpy generator is seeded from the `random` module, so runs seeded with
+    random.seed() stay reproducible.
+    """
+
+    def __init__(self, size: int, rng: Optional[np.random.Generator] = None):
+        self.size = size
+        self.rng = rng or np.random.default_rng(random.getrandbits(64))
+        self.columns: Dict[str, List[Any]] = {}
+
+    def choice(self, name: str, options: Sequence[Any], weights: Optional[Sequence[float]] = None) -> 'BatchSampler':
+        """Draw one of options per record, optionally weighted"""
+        p = None
+        if weights is not None:
+            p = np.asarray(weights, dtype=float)
+            p = p / p.sum()
+        indices = self.rng.choice(len(options), size=self.size, p=p)
+        self.columns[name] = [options[i] for i in indices.tolist()]
+        return self
+
+    def integers(self, name: str, low: int, high: int) -> 'BatchSampler':
+        """Draw an integer in [low, high] per record (inclusive, like random.randint)"""
+        self.columns[name] = self.rng.integers(low, high, size=self.size, endpoint=True).tolist()
+        return self
+
+    def uniform(self, name: str) -> 'BatchSampler':
+        """Draw a float in [0, 1) per record"""
+        self.columns[name] = self.rng.random(self.size).tolist()
+        return self
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, i: int) -> Dict[str, Any]:
+        return {name: column[i] for name, column in self.columns.items()}
@@ -0,0 +1,46 @@
+"""
+Batched random UUID generation - one os.urandom call per block of ids
+"""
+
+import os
+import threading
+
+# Ids formatted per refill
+_BLOCK_SIZE = 256
+
+_local = threading.local()
+
+
+def _reset_after_fork():
+    """Drop the inherited block so forked workers never hand out the parent's ids"""
+    global _local
+    _local = threading.local()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _refill() -> list:
+    """Draw a block of random bytes and format it as version 4 UUID strings"""
+    raw = bytearray(os.urandom(16 * _BLOCK_SIZE))
+    # RFC 4122 version (4) and variant (10xx) bits, as uuid.uuid4() sets them
+    raw[6::16] = bytes((b & 0x0F) | 0x40 for b in raw[6::16])
+    raw[8::16] = bytes((b & 0x3F) | 0x80 for b in raw[8::16])
+    h = raw.hex()
+    block = [
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, len(h), 32)
+    ]
+    # Handed out with pop(), so reverse to keep draw order
+    block.reverse()
+    _local.block = block
+    return block
+
+
+def next_uuid_str() -> str:
+    """Random UUID string, equivalent to str(uuid.uuid4())"""
+    block = getattr(_local, 'block', None)
+    if not block:
+        block = _refill()
+    return block.pop()
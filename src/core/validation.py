@@ -3,14 +3,66 @@ Advanced data validation and consistency checking system
 """
 
 import re
+import sys
+from collections import Counter
 import datetime
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import ClassVar, Dict, FrozenSet, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+import numpy as np
 import phonenumbers
 from email_validator import validate_email, EmailNotValidError
 import logging
 
+# Well-known placeholder and publicly misused SSNs (078-05-1120 from the 1938
+# Woolworth wallet card, 219-09-9999 from an SSA advertisement) rejected outright
+_INVALID_SSNS = frozenset({
+    '000000000', '123456789', '111111111', '987654321', '078051120', '219099999',
+})
+
+# Separators stripped from SSNs before the digit check
+_SSN_SEPARATORS = str.maketrans('', '', '-. ()')
+
+
+def _ssn_digits(ssn: str) -> str:
+    """Digits of an SSN; str.translate handles the usual separators without
+    the regex engine, anything else falls back to stripping all non-digits"""
+    clean = ssn.translate(_SSN_SEPARATORS)
+    if clean.isascii() and clean.isdigit():
+        return clean
+    return re.sub(r'[^0-9]', '', ssn)
+
+
+def _parse_date(value: str) -> datetime.date:
+    """Parse a '%Y-%m-%d' date; zero-padded ISO dates skip strptime"""
+    if (len(value) == 10 and value[4] == '-' and value[7] == '-'
+            and value[:4].isdigit() and value[5:7].isdigit() and value[8:].isdigit()):
+        return datetime.date(int(value[:4]), int(value[5:7]), int(value[8:]))
+    return datetime.datetime.strptime(value, '%Y-%m-%d').date()
+
+
+def _is_zip_code(zip_code: str) -> bool:
+    """XXXXX or XXXXX-XXXX"""
+    if len(zip_code) == 5:
+        return zip_code.isdecimal()
+    return (len(zip_code) == 10 and zip_code[5] == '-'
+            and zip_code[:5].isdecimal() and zip_code[6:].isdecimal())
+
+
+@lru_cache(maxsize=100_000)
+def _us_phone_is_valid(full_number: str) -> Optional[bool]:
+    """phonenumbers validity of a US number, None if it can't be parsed
+    
+    Parsing and validating go through phonenumbers' metadata and are slow;
+    generated data repeats numbers, so results are cached per number.
+    """
+    try:
+        return phonenumbers.is_valid_number(phonenumbers.parse(f"+1{full_number}", "US"))
+    except Exception:
+        return None
+
+
 class ValidationSeverity(Enum):
     WARNING = "warning"
     ERROR = "error"
@@ -23,7 +75,11 @@ class ValidationCategory(Enum):
     BUSINESS_LOGIC = "business_logic"
     REFERENCE_INTEGRITY = "reference_integrity"
 
-@dataclass
+# Results are created per field per record; slots drop the per-instance __dict__
+# (dataclass slots need Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class ValidationResult:
     is_valid: bool
     severity: ValidationSeverity
@@ -37,6 +93,24 @@ class ValidationResult:
 class DataValidator:
     """Comprehensive data validation system"""
     
+    # US states for validation
+    us_states: ClassVar[FrozenSet[str]] = frozenset({
+        'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
+        'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
+        'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
+        'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
+        'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY'
+    })
+    
+    # Blood types
+    blood_types: ClassVar[FrozenSet[str]] = frozenset({'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'})
+    
+    # Gender values
+    valid_genders: ClassVar[FrozenSet[str]] = frozenset({'M', 'F', 'O', 'U'})
+    
+    # Address fields that must be present
+    required_address_fields: ClassVar[Tuple[str, ...]] = ('street_1', 'city', 'state', 'zip_code')
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
@@ -44,30 +118,94 @@ class DataValidator:
         self.ssn_pattern = re.compile(r'^\d{3}-?\d{2}-?\d{4}$')
         self.zip_code_pattern = re.compile(r'^\d{5}(-\d{4})?$')
         self.phone_pattern = re.compile(r'^\+?1?[-.\s]?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})$')
-        
-        # US states for validation
-        self.us_states = {
-            'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
-            'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
-            'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
-            'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
-            'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY'
-        }
-        
-        # Blood types
-        self.blood_types = {'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'}
-        
-        # Gender values
-        self.valid_genders = {'M', 'F', 'O', 'U'}
     
     def validate_person(self, person_data: Dict[str, Any]) -> List[ValidationResult]:
         """Validate a complete person record"""
+        return self._validate_person(person_data)
+    
+    def validate_persons(self, records: List[Dict[str, Any]]) -> List[List[ValidationResult]]:
+        """Validate many person records; same results as validate_person on each
+        
+        The SSN, date of birth and financial checks are screened column-wise
+        first, and their per-field validators only run for records the screen flags.
+        """
+        ssn_ok = self._screen_ssns([r.get('ssn') for r in records])
+        today = datetime.date.today()
+        dob_ok = self._screen_dates_of_birth([r.get('date_of_birth') for r in records], today)
+        financial_ok = self._screen_financial_profiles(records)
+        return [
+            self._validate_person(record, check_ssn=not ssn_ok[i], check_dob=not dob_ok[i],
+                                  check_financial=not financial_ok[i], today=today)
+            for i, record in enumerate(records)
+        ]
+    
+    @staticmethod
+    def _screen_ssns(ssns: List[Any]) -> 'np.ndarray':
+        """Mask of SSNs _validate_ssn would pass without a result"""
+        clean = [_ssn_digits(ssn) if isinstance(ssn, str) else '' for ssn in ssns]
+        lengths = np.fromiter(map(len, clean), dtype=np.int64, count=len(clean))
+        digits = np.array(clean, dtype='U9')
+        area = digits.astype('U3')
+        return ((lengths == 9) & ~np.isin(digits, list(_INVALID_SSNS))
+                & ~np.isin(area, ('000', '666')) & (area < '900'))
+    
+    @staticmethod
+    def _screen_dates_of_birth(dobs: List[Any], today: datetime.date) -> 'np.ndarray':
+        """Mask of dates of birth _validate_date_of_birth would pass without a result"""
+        # Dates as YYYYMMDD integers: the difference // 10000 is the age in whole
+        # years, birthday included; anything that isn't a date goes to the full check
+        is_date = np.fromiter((isinstance(dob, datetime.date) for dob in dobs), dtype=bool, count=len(dobs))
+        dob_keys = np.fromiter(
+            (dob.year * 10000 + dob.month * 100 + dob.day if isinstance(dob, datetime.date) else 0
+             for dob in dobs),
+            dtype=np.int64, count=len(dobs)
+        )
+        ages = (today.year * 10000 + today.month * 100 + today.day - dob_keys) // 10000
+        return is_date & ((ages == 0) | ((ages >= 18) & (ages <= 150)))
+    
+    @staticmethod
+    def _screen_financial_profiles(records: List[Dict[str, Any]]) -> 'np.ndarray':
+        """Mask of records _validate_financial_profile would pass without a result
+        (records with no financial_profile key pass: it isn't called for them)"""
+        size = len(records)
+        present = np.zeros(size, dtype=bool)
+        numeric = np.ones(size, dtype=bool)
+        credit = np.full(size, np.nan)
+        income = np.full(size, np.nan)
+        ratio = np.full(size, np.nan)
+        
+        for i, record in enumerate(records):
+            if 'financial_profile' not in record:
+                continue
+            present[i] = True
+            financial = record['financial_profile']
+            if not isinstance(financial, dict):
+                numeric[i] = False
+                continue
+            for column, key in ((credit, 'credit_score'), (income, 'annual_income'), (ratio, 'debt_to_income_ratio')):
+                value = financial.get(key)
+                if value is None:
+                    continue
+                if isinstance(value, (int, float)):
+                    column[i] = value
+                else:
+                    numeric[i] = False
+        
+        # NaN (missing) compares False, so it never counts as out of range
+        in_range = ~((credit < 300) | (credit > 850) | (income < 0) | (ratio < 0) | (ratio > 10))
+        return ~present | (numeric & in_range)
+    
+    def _validate_person(self, person_data: Dict[str, Any], check_ssn: bool = True,
+                         check_dob: bool = True, check_financial: bool = True,
+                         today: Optional[datetime.date] = None) -> List[ValidationResult]:
         results = []
         
         # Basic field validation
-        results.extend(self._validate_ssn(person_data.get('ssn')))
+        if check_ssn:
+            results.extend(self._validate_ssn(person_data.get('ssn')))
         results.extend(self._validate_name_fields(person_data))
-        results.extend(self._validate_date_of_birth(person_data.get('date_of_birth')))
+        if check_dob:
+            results.extend(self._validate_date_of_birth(person_data.get('date_of_birth'), today))
         results.extend(self._validate_gender(person_data.get('gender')))
         
         # Address validation
@@ -86,7 +224,7 @@ class DataValidator:
                 results.extend(self._validate_email(email, f"email_addresses[{i}]"))
         
         # Financial validation
-        if 'financial_profile' in person_data:
+        if check_financial and 'financial_profile' in person_data:
             results.extend(self._validate_financial_profile(person_data['financial_profile']))
         
         # Medical validation
@@ -126,7 +264,7 @@ class DataValidator:
             return results
         
         # Remove formatting for validation
-        clean_ssn = re.sub(r'[^0-9]', '', ssn)
+        clean_ssn = _ssn_digits(ssn)
         
         if len(clean_ssn) != 9:
             results.append(ValidationResult(
@@ -140,7 +278,7 @@ class DataValidator:
             ))
         
         # Check for invalid SSN patterns
-        if clean_ssn in ['000000000', '123456789', '111111111']:
+        if clean_ssn in _INVALID_SSNS:
             results.append(ValidationResult(
                 is_valid=False,
                 severity=ValidationSeverity.ERROR,
@@ -152,7 +290,8 @@ class DataValidator:
             ))
         
         # Check area number (first 3 digits)
-        if clean_ssn and clean_ssn[:3] in ['000', '666'] or clean_ssn[:3] >= '900':
+        area = int(clean_ssn[:3]) if len(clean_ssn) >= 3 else -1
+        if area == 0 or area == 666 or area >= 900:
             results.append(ValidationResult(
                 is_valid=False,
                 severity=ValidationSeverity.ERROR,
@@ -214,7 +353,7 @@ class DataValidator:
         
         return results
     
-    def _validate_date_of_birth(self, dob: Any) -> List[ValidationResult]:
+    def _validate_date_of_birth(self, dob: Any, today: Optional[datetime.date] = None) -> List[ValidationResult]:
         """Validate date of birth"""
         results = []
         
@@ -231,7 +370,7 @@ class DataValidator:
         # Convert string to date if needed
         if isinstance(dob, str):
             try:
-                dob = datetime.datetime.strptime(dob, '%Y-%m-%d').date()
+                dob = _parse_date(dob)
             except ValueError:
                 results.append(ValidationResult(
                     is_valid=False,
@@ -256,7 +395,8 @@ class DataValidator:
             return results
         
         # Check realistic date ranges
-        today = datetime.date.today()
+        if today is None:
+            today = datetime.date.today()
         age = today.year - dob.year - ((today.month, today.day) < (dob.month, dob.day))
         
         if age < 0:
@@ -305,7 +445,7 @@ class DataValidator:
             return results
         
         # Handle enum values
-        gender_value = gender.value if hasattr(gender, 'value') else gender
+        gender_value = getattr(gender, 'value', gender)
         
         if gender_value not in self.valid_genders:
             results.append(ValidationResult(
@@ -325,8 +465,7 @@ class DataValidator:
         results = []
         
         # Required fields
-        required_fields = ['street_1', 'city', 'state', 'zip_code']
-        for field in required_fields:
+        for field in self.required_address_fields:
             if not address.get(field):
                 results.append(ValidationResult(
                     is_valid=False,
@@ -351,7 +490,7 @@ class DataValidator:
         
         # ZIP code validation
         zip_code = address.get('zip_code')
-        if zip_code and not self.zip_code_pattern.match(str(zip_code)):
+        if zip_code and not _is_zip_code(str(zip_code)):
             results.append(ValidationResult(
                 is_valid=False,
                 severity=ValidationSeverity.ERROR,
@@ -384,18 +523,17 @@ class DataValidator:
         # Construct full number for validation
         full_number = f"{area_code}{number}"
         
-        try:
-            parsed = phonenumbers.parse(f"+1{full_number}", "US")
-            if not phonenumbers.is_valid_number(parsed):
-                results.append(ValidationResult(
-                    is_valid=False,
-                    severity=ValidationSeverity.ERROR,
-                    category=ValidationCategory.FORMAT,
-                    field_name=f'{field_prefix}',
-                    message='Invalid phone number',
-                    original_value=full_number
-                ))
-        except:
+        is_valid = _us_phone_is_valid(full_number)
+        if is_valid is False:
+            results.append(ValidationResult(
+                is_valid=False,
+                severity=ValidationSeverity.ERROR,
+                category=ValidationCategory.FORMAT,
+                field_name=f'{field_prefix}',
+                message='Invalid phone number',
+                original_value=full_number
+            ))
+        elif is_valid is None:
             results.append(ValidationResult(
                 is_valid=False,
                 severity=ValidationSeverity.ERROR,
@@ -519,20 +657,18 @@ class DataValidator:
         if dob:
             if isinstance(dob, str):
                 try:
-                    dob = datetime.datetime.strptime(dob, '%Y-%m-%d').date()
-                except:
+                    dob = _parse_date(dob)
+                except ValueError:
                     return results  # Skip if date is invalid
             
-            age = datetime.date.today().year - dob.year
-            
             employment_history = person_data.get('employment_history', [])
             for i, job in enumerate(employment_history):
                 start_date = job.get('start_date')
                 if start_date:
                     if isinstance(start_date, str):
                         try:
-                            start_date = datetime.datetime.strptime(start_date, '%Y-%m-%d').date()
-                        except:
+                            start_date = _parse_date(start_date)
+                        except ValueError:
                             continue
                     
                     age_at_start = start_date.year - dob.year
@@ -587,44 +723,34 @@ class DataValidator:
             "suggested_fixes": []
         }
         
+        # Count by severity/category in one pass each (first-seen order, as before)
+        severities = Counter(result.severity for result in validation_results)
+        report["by_severity"] = {severity.value: n for severity, n in severities.items()}
+        report["by_category"] = dict(Counter(result.category.value for result in validation_results))
+        
+        # Organize by severity
+        issue_lists = {
+            ValidationSeverity.CRITICAL: report["critical_issues"],
+            ValidationSeverity.ERROR: report["errors"],
+        }
+        warnings = report["warnings"]
+        suggested_fixes = report["suggested_fixes"]
         for result in validation_results:
-            # Count by severity
-            severity = result.severity.value
-            report["by_severity"][severity] = report["by_severity"].get(severity, 0) + 1
-            
-            # Count by category
-            category = result.category.value
-            report["by_category"][category] = report["by_category"].get(category, 0) + 1
-            
-            # Organize by severity
-            if result.severity == ValidationSeverity.CRITICAL:
-                report["critical_issues"].append({
-                    "field": result.field_name,
-                    "message": result.message,
-                    "suggested_fix": result.suggested_fix
-                })
-            elif result.severity == ValidationSeverity.ERROR:
-                report["errors"].append({
-                    "field": result.field_name,
-                    "message": result.message,
-                    "suggested_fix": result.suggested_fix
-                })
-            else:
-                report["warnings"].append({
-                    "field": result.field_name,
-                    "message": result.message,
-                    "suggested_fix": result.suggested_fix
-                })
+            issue_lists.get(result.severity, warnings).append({
+                "field": result.field_name,
+                "message": result.message,
+                "suggested_fix": result.suggested_fix
+            })
             
             # Collect suggested fixes
             if result.suggested_fix:
-                report["suggested_fixes"].append({
+                suggested_fixes.append({
                     "field": result.field_name,
                     "fix": result.suggested_fix
                 })
         
         # Determine overall status
-        if not any(r.severity in [ValidationSeverity.CRITICAL, ValidationSeverity.ERROR] for r in validation_results):
+        if not (severities[ValidationSeverity.CRITICAL] or severities[ValidationSeverity.ERROR]):
             report["overall_status"] = "VALID_WITH_WARNINGS"
         
         return report
\ No newline at end of file
@@ -7,6 +7,14 @@ import re
 from src.core.constants import TYPO_PATTERNS, COMMON_MISSPELLINGS
 
 
+# Misspelling table prepared once: lowercased word for the membership test,
+# compiled case-insensitive pattern for the substitution
+_MISSPELLING_PATTERNS = [
+    (word.lower(), re.compile(word, re.IGNORECASE), misspellings)
+    for word, misspellings in COMMON_MISSPELLINGS.items()
+]
+
+
 class VariabilityEngine:
     """Engine for introducing realistic data quality issues and variations"""
     
@@ -53,10 +61,11 @@ class VariabilityEngine:
             
         elif typo_type == 'misspell':
             # Use common misspelling patterns
-            for word, misspellings in COMMON_MISSPELLINGS.items():
-                if word.lower() in text.lower():
+            lowered = text.lower()
+            for word, pattern, misspellings in _MISSPELLING_PATTERNS:
+                if word in lowered:
                     misspelled = random.choice(misspellings)
-                    return re.sub(word, misspelled, text, flags=re.IGNORECASE)
+                    return pattern.sub(misspelled, text)
             
             # Use typo patterns
             for correct, typo in TYPO_PATTERNS:
@@ -1,13 +1,18 @@
 """Enhanced Azure SQL Database operations with flexible configuration"""
 
 import pyodbc
-import pandas as pd
 from typing import List, Optional, Dict, Any, Iterator
 import logging
 from contextlib import contextmanager
 import time
 from dataclasses import asdict
 import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import uuid
 from datetime import datetime, date
 
 from src.core.models import Person, Address, PhoneNumber, EmailAddress, Employment, FinancialProfile
@@ -23,18 +28,25 @@ class EnhancedAzureSQLDatabase:
         self.schema = config.schema_config.name
         self.logger = logging.getLogger(__name__)
         
-        # SQL Server bulk insert settings
+        # SQL Server bulk insert settings. fast_executemany is a cursor attribute;
+        # passing it to pyodbc.connect() would only append it to the connection string
         self.bulk_options = {
             'fast_executemany': True,
             'autocommit': False
         }
+        # Whether the bcp on PATH reads UTF-8 files (-C 65001), probed on first load
+        self._bcp_utf8: Optional[bool] = None
+        # Fail before generating anything when bcp cannot authenticate safely
+        if config.data_insertion.bulk_mode == 'bcp':
+            config.validate_bulk_mode()
+            self._bcp_connection_args()
         
     @contextmanager
     def get_connection(self):
         """Get database connection with proper cleanup"""
         conn = None
         try:
-            conn = pyodbc.connect(self.connection_string, **self.bulk_options)
+            conn = pyodbc.connect(self.connection_string, autocommit=self.bulk_options['autocommit'])
             yield conn
         except Exception as e:
             if conn:
@@ -162,6 +174,8 @@ class EnhancedAzureSQLDatabase:
         
         with self.get_connection() as conn:
             cursor = conn.cursor()
+            # Send each executemany() as one array-bound batch instead of a round trip per row
+            cursor.fast_executemany = self.bulk_options['fast_executemany']
             
             try:
                 # Process in batches
@@ -187,32 +201,23 @@ class EnhancedAzureSQLDatabase:
     
     def _filter_duplicates(self, cursor, people: List[Person]) -> List[Person]:
         """Filter out duplicate people based on configured key columns"""
-        if not self.config.data_insertion.duplicate_key_columns.get('people'):
+        where_clause = self.config.data_insertion.get_duplicate_key_sql('people')
+        if not where_clause:
             return people
         
         key_columns = self.config.data_insertion.duplicate_key_columns['people']
         table_name = self.config.get_table_name('people')
+        sql = f"SELECT COUNT(*) FROM {self.schema}.{table_name} WHERE {where_clause}"
         
         filtered_people = []
         
         for person in people:
-            # Build WHERE clause for duplicate check
-            where_conditions = []
-            values = []
+            cursor.execute(sql, [getattr(person, col) for col in key_columns])
             
-            for col in key_columns:
-                if col == 'ssn':
-                    where_conditions.append(f"{col} = ?")
-                    values.append(person.ssn)
-            
-            if where_conditions:
-                where_clause = " AND ".join(where_conditions)
-                cursor.execute(f"SELECT COUNT(*) FROM {self.schema}.{table_name} WHERE {where_clause}", values)
-                
-                if cursor.fetchone()[0] == 0:
-                    filtered_people.append(person)
-                else:
-                    self.logger.debug(f"Skipping duplicate person: {person.person_id}")
+            if cursor.fetchone()[0] == 0:
+                filtered_people.append(person)
+            else:
+                self.logger.debug(f"Skipping duplicate person: {person.person_id}")
         
         return filtered_people
     
@@ -254,24 +259,31 @@ class EnhancedAzureSQLDatabase:
             if self.config.schema_config.tables.get('financial_profiles', True) and person.financial_profile:
                 financial_data.append(self._financial_to_tuple(person.financial_profile, person.person_id))
         
-        # Bulk insert each table
+        # Bulk insert each table (parents first)
+        loads = []
         if self.config.schema_config.tables.get('people', True):
-            self._bulk_insert_table(cursor, 'people', people_data, self._get_people_columns())
+            loads.append(('people', people_data, self._get_people_columns()))
         
         if addresses_data and self.config.schema_config.tables.get('addresses', True):
-            self._bulk_insert_table(cursor, 'addresses', addresses_data, self._get_addresses_columns())
+            loads.append(('addresses', addresses_data, self._get_addresses_columns()))
         
         if phones_data and self.config.schema_config.tables.get('phone_numbers', True):
-            self._bulk_insert_table(cursor, 'phone_numbers', phones_data, self._get_phones_columns())
+            loads.append(('phone_numbers', phones_data, self._get_phones_columns()))
         
         if emails_data and self.config.schema_config.tables.get('email_addresses', True):
-            self._bulk_insert_table(cursor, 'email_addresses', emails_data, self._get_emails_columns())
+            loads.append(('email_addresses', emails_data, self._get_emails_columns()))
         
         if employment_data and self.config.schema_config.tables.get('employment_history', True):
-            self._bulk_insert_table(cursor, 'employment_history', employment_data, self._get_employment_columns())
+            loads.append(('employment_history', employment_data, self._get_employment_columns()))
         
         if financial_data and self.config.schema_config.tables.get('financial_profiles', True):
-            self._bulk_insert_table(cursor, 'financial_profiles', financial_data, self._get_financial_columns())
+            loads.append(('financial_profiles', financial_data, self._get_financial_columns()))
+        
+        if self.config.data_insertion.bulk_mode == 'bcp':
+            self._bcp_insert_tables(cursor, loads)
+        else:
+            for table_name, data, columns in loads:
+                self._bulk_insert_table(cursor, table_name, data, columns)
     
     def _bulk_insert_table(self, cursor, table_name: str, data: List[tuple], columns: List[str]):
         """Perform bulk insert for a specific table"""
@@ -284,6 +296,154 @@ class EnhancedAzureSQLDatabase:
         
         cursor.executemany(sql, data)
     
+    def _bcp_insert_tables(self, cursor, loads: List[tuple]):
+        """Load (table_name, data, columns) tables through the bcp utility (TDS bulk copy)
+        
+        bcp commits on its own connection, so each table is bulk copied into a
+        global temp staging table first. The rows only reach the real tables
+        through INSERT ... SELECT on this cursor, inside the caller's transaction,
+        so a failure part way through a multi-table load leaves no table loaded.
+        """
+        loads = [load for load in loads if load[1]]
+        if not loads:
+            return
+        
+        staged = []
+        try:
+            # The transaction holds no rows yet (batches are committed as they
+            # finish); commit the staging tables so bcp's session can write to them
+            # instead of blocking on the uncommitted CREATE
+            for table_name, data, columns in loads:
+                full_table_name = self.config.get_table_name(table_name)
+                staging = f"##{full_table_name}_{uuid.uuid4().hex}"
+                cursor.execute(
+                    f"SELECT TOP 0 {', '.join(columns)} INTO {staging} "
+                    f"FROM {self.schema}.{full_table_name}"
+                )
+                staged.append((staging, full_table_name, data, columns))
+            cursor.commit()
+            
+            for staging, full_table_name, data, columns in staged:
+                self._bcp_copy(staging, full_table_name, data)
+            
+            for staging, full_table_name, data, columns in staged:
+                column_list = ', '.join(columns)
+                cursor.execute(
+                    f"INSERT INTO {self.schema}.{full_table_name} ({column_list}) "
+                    f"SELECT {column_list} FROM {staging}"
+                )
+        finally:
+            for staging, *_ in staged:
+                try:
+                    cursor.execute(f"DROP TABLE IF EXISTS {staging}")
+                except pyodbc.Error as e:
+                    # Global temp tables also go away when this connection closes
+                    self.logger.warning(f"Could not drop staging table {staging}: {e}")
+    
+    def _bcp_copy(self, staging: str, full_table_name: str, data: List[tuple]):
+        """Bulk copy rows into a staging table whose columns match the row tuples"""
+        # UTF-8 character files need a bcp that accepts -C 65001; older builds
+        # get the same rows as a UTF-16 (-w) file instead
+        if self._bcp_utf8 is None:
+            self._bcp_utf8 = self._bcp_supports_utf8()
+        if self._bcp_utf8:
+            encoding, format_args = 'utf-8', ['-c', '-C', '65001']
+        else:
+            encoding, format_args = 'utf-16-le', ['-w']
+        
+        with tempfile.TemporaryDirectory(prefix='pii_bcp_') as tmp_dir:
+            data_path = os.path.join(tmp_dir, f'{full_table_name}.dat')
+            with open(data_path, 'w', encoding=encoding, newline='\n') as f:
+                for row in data:
+                    f.write('\t'.join(map(self._bcp_field, row)))
+                    f.write('\n')
+            
+            # -E keeps file values for columns SELECT INTO copied as IDENTITY
+            command = [
+                'bcp', staging, 'in', data_path,
+                *format_args, '-t', '\t', '-r', '\n', '-E', '-m', '1',
+                '-b', str(self.config.data_insertion.batch_size),
+                *self._bcp_connection_args()
+            ]
+            result = subprocess.run(command, capture_output=True, text=True)
+        
+        if result.returncode != 0:
+            output = self._scrub_password((result.stdout or result.stderr).strip())
+            raise RuntimeError(f"bcp failed for {full_table_name}: {output}")
+    
+    @staticmethod
+    def _bcp_supports_utf8() -> bool:
+        """Whether the bcp on PATH accepts code page 65001
+        
+        Windows bcp takes it from version 13; the Linux/macOS mssql-tools builds
+        reject it before version 17. An unreadable version counts as no.
+        """
+        try:
+            result = subprocess.run(['bcp', '-v'], capture_output=True, text=True)
+        except OSError:
+            return False
+        match = re.search(r'Version:?\s*(\d+)\.', result.stdout or result.stderr or '')
+        if not match:
+            return False
+        return int(match.group(1)) >= (13 if sys.platform == 'win32' else 17)
+    
+    @staticmethod
+    def _bcp_field(value: Any) -> str:
+        """Render a value for a bcp character-mode file (empty field loads as NULL)"""
+        if value is None:
+            return ''
+        if isinstance(value, bool):
+            return '1' if value else '0'
+        if isinstance(value, datetime):
+            return value.isoformat(sep=' ')
+        if isinstance(value, date):
+            return value.isoformat()
+        # Field and row terminators cannot be escaped in character mode
+        return re.sub(r'[\t\r\n]', ' ', str(value))
+    
+    def _connection_params(self) -> Dict[str, str]:
+        """Parse the ODBC connection string into lower-cased keywords"""
+        return {
+            key.strip().lower(): value[1:-1].replace('}}', '}') if value.startswith('{') else value.strip()
+            for key, value in re.findall(r'([^;=]+)=(\{(?:[^}]|\}\})*\}|[^;]*)', self.connection_string)
+        }
+    
+    def _bcp_connection_args(self) -> List[str]:
+        """Translate the ODBC connection string into bcp -S/-d and authentication arguments
+        
+        bcp only takes a SQL password through -P, which exposes it in the process list,
+        so bcp loads are limited to trusted (-T) or Azure AD (-G) authentication.
+        """
+        params = self._connection_params()
+        
+        args = ['-S', params.get('server', '')]
+        database = params.get('database') or params.get('initial catalog')
+        if database:
+            args += ['-d', database]
+        username = params.get('uid') or params.get('user id')
+        password = params.get('pwd') or params.get('password')
+        authentication = params.get('authentication', '').lower()
+        if password or (username and not authentication.startswith('activedirectory')):
+            raise ValueError(
+                "bcp bulk mode does not pass SQL passwords on the command line; use trusted or "
+                "Azure AD authentication (Authentication=ActiveDirectory...) or --bulk-mode executemany"
+            )
+        if authentication.startswith('activedirectory'):
+            args.append('-G')
+            if username:
+                args += ['-U', username]
+        else:
+            args.append('-T')
+        if params.get('trustservercertificate', '').lower() == 'yes':
+            args.append('-u')
+        return args
+    
+    def _scrub_password(self, text: str) -> str:
+        """Mask the connection password wherever it appears in tool output"""
+        params = self._connection_params()
+        password = params.get('pwd') or params.get('password')
+        return text.replace(password, '****') if password else text
+    
     # Data conversion methods (same as original)
     def _person_to_tuple(self, person: Person) -> tuple:
         """Convert Person to tuple for bulk insert"""
@@ -298,7 +458,7 @@ class EnhancedAzureSQLDatabase:
             person.nickname,
             person.maiden_name,
             person.date_of_birth,
-            person.gender.value,
+            person.gender,
             person.created_at,
             person.updated_at
         )
@@ -308,7 +468,7 @@ class EnhancedAzureSQLDatabase:
         return (
             address.address_id,
             person_id,
-            address.address_type.value,
+            address.address_type,
             address.street_1,
             address.street_2,
             address.city,
@@ -357,7 +517,7 @@ class EnhancedAzureSQLDatabase:
             employment.job_title,
             employment.department,
             employment.industry,
-            employment.employment_status.value,
+            employment.employment_status,
             employment.start_date,
             employment.end_date,
             employment.salary,
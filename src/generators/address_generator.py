@@ -1,5 +1,6 @@
 import random
 from datetime import date, timedelta
+from itertools import accumulate
 from typing import List, Dict, Optional, Tuple
 import string
 
@@ -10,6 +11,20 @@ from src.core.variability import VariabilityEngine
 from src.core.models import Address, AddressType
 
 
+# Address style distribution, accumulated once for random.choices
+ADDRESS_STYLE_WEIGHTS = {
+    "standard": 0.85,
+    "po_box": 0.08,
+    "rural": 0.04,
+    "military": 0.03
+}
+_ADDRESS_STYLES = list(ADDRESS_STYLE_WEIGHTS)
+_ADDRESS_STYLE_CUM_WEIGHTS = list(accumulate(ADDRESS_STYLE_WEIGHTS.values()))
+
+# Rural addresses use the smaller towns at the end of the city table
+_RURAL_CITY_STATE_ZIP_DATA = CITY_STATE_ZIP_DATA[-20:]
+
+
 class AddressGenerator:
     """Advanced address generator with real geographic data and variations"""
     
@@ -159,7 +174,7 @@ class AddressGenerator:
         box_number = random.randint(1, 9999)
         
         # Rural areas - pick smaller cities/towns
-        city, state, zips = random.choice(CITY_STATE_ZIP_DATA[-20:])  # Last entries tend to be smaller
+        city, state, zips = random.choice(_RURAL_CITY_STATE_ZIP_DATA)
         zip_code = random.choice(zips) + f"{random.randint(0, 9999):04d}"
         
         street_1 = f"{rural_type} {route_number} Box {box_number}"
@@ -246,17 +261,7 @@ class AddressGenerator:
                        previous_addresses: Optional[List[Address]] = None) -> Address:
         """Generate complete address with specified type"""
         # Determine address style
-        style_weights = {
-            "standard": 0.85,
-            "po_box": 0.08,
-            "rural": 0.04,
-            "military": 0.03
-        }
-        
-        style = random.choices(
-            list(style_weights.keys()),
-            weights=list(style_weights.values())
-        )[0]
+        style = random.choices(_ADDRESS_STYLES, cum_weights=_ADDRESS_STYLE_CUM_WEIGHTS)[0]
         
         # Generate based on style
         if style == "po_box":
@@ -269,11 +274,8 @@ class AddressGenerator:
             # For previous addresses, maybe use same city
             if previous_addresses and random.random() < 0.3:
                 prev_addr = random.choice(previous_addresses)
-                city_state_zip = None
-                for c, s, z in CITY_STATE_ZIP_DATA:
-                    if c == prev_addr.city and s == prev_addr.state:
-                        city_state_zip = (c, s, z)
-                        break
+                zips = self.zip_by_city.get(f"{prev_addr.city},{prev_addr.state}")
+                city_state_zip = (prev_addr.city, prev_addr.state, zips) if zips else None
                 addr_data = self.generate_standard_address(city_state_zip)
             else:
                 addr_data = self.generate_standard_address()
@@ -343,7 +345,8 @@ class AddressGenerator:
             if random.random() < 0.8:
                 # Same as current
                 billing = current.model_copy()
-                billing.address_type = AddressType.BILLING
+                # Assignment skips validation, so store the plain value like the validated fields
+                billing.address_type = AddressType.BILLING.value
                 billing.address_id = str(random.randint(1000000, 9999999))
             else:
                 billing = self.generate_address(AddressType.BILLING)
@@ -7,7 +7,9 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel
 from enum import Enum
-import uuid
+
+from src.core.sampling import BatchSampler
+from src.core.uuid_pool import next_uuid_str
 
 class CommunicationType(Enum):
     PHONE_CALL = "phone_call"
@@ -108,6 +110,35 @@ class CommunicationProfile(BaseModel):
     blocked_contacts: List[str]
     communication_statistics: Dict[str, Any]
 
+# Per-record lookup tables, built once rather than for every communication record
+PLATFORM_TO_TYPE = {
+    Platform.PHONE: CommunicationType.PHONE_CALL,
+    Platform.SMS: CommunicationType.TEXT_MESSAGE,
+    Platform.EMAIL: CommunicationType.EMAIL,
+    Platform.WHATSAPP: CommunicationType.TEXT_MESSAGE,
+    Platform.FACEBOOK: CommunicationType.SOCIAL_MEDIA,
+    Platform.INSTAGRAM: CommunicationType.SOCIAL_MEDIA,
+    Platform.TWITTER: CommunicationType.SOCIAL_MEDIA,
+    Platform.LINKEDIN: CommunicationType.SOCIAL_MEDIA,
+    Platform.DISCORD: CommunicationType.INSTANT_MESSAGE,
+    Platform.SLACK: CommunicationType.INSTANT_MESSAGE,
+    Platform.ZOOM: CommunicationType.VIDEO_CALL,
+    Platform.TEAMS: CommunicationType.VIDEO_CALL,
+    Platform.SKYPE: CommunicationType.VIDEO_CALL
+}
+
+# Direction (60% outgoing, 35% incoming, 5% missed)
+_DIRECTIONS = [CommunicationDirection.OUTGOING, CommunicationDirection.INCOMING, CommunicationDirection.MISSED]
+_DIRECTION_WEIGHTS = [60, 35, 5]
+
+# Hour of day, weighted toward active hours
+_HOURS = range(24)
+_HOUR_WEIGHTS = [1, 1, 1, 1, 1, 1, 2, 4, 6, 8, 8, 8, 8, 8, 8, 8, 8, 6, 4, 3, 2, 2, 1, 1]
+
+_CALL_TYPES = frozenset({CommunicationType.PHONE_CALL, CommunicationType.VIDEO_CALL})
+_MESSAGE_TYPES = frozenset({CommunicationType.TEXT_MESSAGE, CommunicationType.EMAIL, CommunicationType.INSTANT_MESSAGE})
+_GROUP_PLATFORMS = frozenset({Platform.DISCORD, Platform.SLACK, Platform.WHATSAPP})
+
 class CommunicationGenerator:
     def __init__(self):
         self.first_names = [
@@ -276,7 +307,7 @@ class CommunicationGenerator:
         is_emergency = relationship in [ContactRelationship.FAMILY, ContactRelationship.ROMANTIC_PARTNER] and random.random() < 0.6
         
         return Contact(
-            contact_id=str(uuid.uuid4()),
+            contact_id=next_uuid_str(),
             name=name,
             phone_number=phone_number if random.random() < 0.9 else None,
             email=email if random.random() < 0.8 else None,
@@ -346,7 +377,11 @@ class CommunicationGenerator:
         elif age > 60:
             daily_volume = int(daily_volume * 0.7)  # Older people communicate less
         
-        # Generate records for last 90 days
+        if not contacts:
+            return records
+        
+        # Day of each record for the last 90 days
+        record_dates = []
         for day in range(90):
             date = datetime.now() - timedelta(days=day)
             
@@ -354,88 +389,71 @@ class CommunicationGenerator:
             is_weekend = date.weekday() >= 5
             day_volume = int(daily_volume * (0.8 if is_weekend else 1.0))
             
-            # Generate communications for this day
-            for _ in range(random.randint(max(1, day_volume - 10), day_volume + 10)):
-                contact = self._select_contact_for_communication(contacts)
-                if contact:
-                    record = self._create_communication_record(contact, date)
-                    records.append(record)
+            record_dates.extend([date] * random.randint(max(1, day_volume - 10), day_volume + 10))
+        
+        # Draw every record's random fields in one pass instead of per record
+        sampler = (BatchSampler(len(record_dates))
+                   .choice('contact', contacts, [contact.frequency_score for contact in contacts])
+                   .choice('direction', _DIRECTIONS, _DIRECTION_WEIGHTS)
+                   .choice('hour', _HOURS, _HOUR_WEIGHTS)
+                   .integers('minute', 0, 59)
+                   .integers('second', 0, 59)
+                   .integers('participant_count', 3, 8)
+                   .uniform('platform')
+                   .uniform('length')
+                   .uniform('success')
+                   .uniform('group')
+                   .uniform('location'))
+        
+        for i, date in enumerate(record_dates):
+            records.append(self._create_communication_record(date, sampler[i]))
         
         return sorted(records, key=lambda x: x.timestamp, reverse=True)
 
-    def _select_contact_for_communication(self, contacts: List[Contact]) -> Optional[Contact]:
-        """Select contact for communication based on frequency scores"""
-        if not contacts:
-            return None
+    def _create_communication_record(self, date: datetime, draws: Dict[str, Any]) -> CommunicationRecord:
+        """Create a single communication record from its pre-drawn random values"""
+        contact = draws['contact']
         
-        # Weight contacts by frequency score
-        weights = [contact.frequency_score for contact in contacts]
-        return random.choices(contacts, weights=weights)[0]
-
-    def _create_communication_record(self, contact: Contact, date: datetime) -> CommunicationRecord:
-        """Create a single communication record"""
         # Select communication type based on contact's platforms
-        platform = random.choice(contact.platforms)
+        platform = contact.platforms[int(draws['platform'] * len(contact.platforms))]
         
         # Map platform to communication type
-        platform_to_type = {
-            Platform.PHONE: CommunicationType.PHONE_CALL,
-            Platform.SMS: CommunicationType.TEXT_MESSAGE,
-            Platform.EMAIL: CommunicationType.EMAIL,
-            Platform.WHATSAPP: CommunicationType.TEXT_MESSAGE,
-            Platform.FACEBOOK: CommunicationType.SOCIAL_MEDIA,
-            Platform.INSTAGRAM: CommunicationType.SOCIAL_MEDIA,
-            Platform.TWITTER: CommunicationType.SOCIAL_MEDIA,
-            Platform.LINKEDIN: CommunicationType.SOCIAL_MEDIA,
-            Platform.DISCORD: CommunicationType.INSTANT_MESSAGE,
-            Platform.SLACK: CommunicationType.INSTANT_MESSAGE,
-            Platform.ZOOM: CommunicationType.VIDEO_CALL,
-            Platform.TEAMS: CommunicationType.VIDEO_CALL,
-            Platform.SKYPE: CommunicationType.VIDEO_CALL
-        }
-        
-        comm_type = platform_to_type.get(platform, CommunicationType.TEXT_MESSAGE)
+        comm_type = PLATFORM_TO_TYPE.get(platform, CommunicationType.TEXT_MESSAGE)
         
         # Direction (60% outgoing, 35% incoming, 5% missed)
-        direction = random.choices(
-            [CommunicationDirection.OUTGOING, CommunicationDirection.INCOMING, CommunicationDirection.MISSED],
-            weights=[60, 35, 5]
-        )[0]
+        direction = draws['direction']
         
         # Random time during the day (weighted toward active hours)
-        hour_weights = [1, 1, 1, 1, 1, 1, 2, 4, 6, 8, 8, 8, 8, 8, 8, 8, 8, 6, 4, 3, 2, 2, 1, 1]
-        hour = random.choices(range(24), weights=hour_weights)[0]
-        timestamp = date.replace(hour=hour, minute=random.randint(0, 59), second=random.randint(0, 59))
+        timestamp = date.replace(hour=draws['hour'], minute=draws['minute'], second=draws['second'])
         
         # Duration for calls
         duration = None
-        if comm_type in [CommunicationType.PHONE_CALL, CommunicationType.VIDEO_CALL]:
+        if comm_type in _CALL_TYPES:
             if direction == CommunicationDirection.MISSED:
                 duration = 0
             else:
-                # Duration based on relationship closeness
+                # Duration based on relationship closeness, 30s up to 3x the base
                 base_duration = contact.closeness_score * 60  # Base seconds
-                duration = random.randint(30, base_duration * 3)
+                duration = 30 + int(draws['length'] * (base_duration * 3 - 29))
         
         # Message length for text-based communications
         message_length = None
-        if comm_type in [CommunicationType.TEXT_MESSAGE, CommunicationType.EMAIL, CommunicationType.INSTANT_MESSAGE]:
+        if comm_type in _MESSAGE_TYPES:
             if comm_type == CommunicationType.EMAIL:
-                message_length = random.randint(50, 500)
+                message_length = 50 + int(draws['length'] * 451)
             else:
-                message_length = random.randint(10, 200)
+                message_length = 10 + int(draws['length'] * 191)
         
         # Success rate (higher for closer contacts)
         success_rate = 0.9 + (contact.closeness_score / 100)
-        was_successful = direction != CommunicationDirection.MISSED and random.random() < success_rate
+        was_successful = direction != CommunicationDirection.MISSED and draws['success'] < success_rate
         
         # Group conversation (more likely for certain platforms)
-        group_platforms = [Platform.DISCORD, Platform.SLACK, Platform.WHATSAPP]
-        group_conversation = platform in group_platforms and random.random() < 0.3
-        participant_count = random.randint(3, 8) if group_conversation else None
+        group_conversation = platform in _GROUP_PLATFORMS and draws['group'] < 0.3
+        participant_count = draws['participant_count'] if group_conversation else None
         
         return CommunicationRecord(
-            record_id=str(uuid.uuid4()),
+            record_id=next_uuid_str(),
             contact_id=contact.contact_id,
             timestamp=timestamp,
             communication_type=comm_type,
@@ -444,7 +462,7 @@ class CommunicationGenerator:
             duration_seconds=duration,
             message_length=message_length,
             was_successful=was_successful,
-            location=contact.location if random.random() < 0.1 else None,
+            location=contact.location if draws['location'] < 0.1 else None,
             group_conversation=group_conversation,
             participant_count=participant_count
         )
@@ -480,7 +498,7 @@ class CommunicationGenerator:
             }.get(contact.relationship, 2)
             
             network.append(SocialNetworkNode(
-                node_id=str(uuid.uuid4()),
+                node_id=next_uuid_str(),
                 contact_id=contact.contact_id,
                 centrality_score=round(centrality, 3),
                 cluster_id=contact.relationship.value,
@@ -621,5 +639,5 @@ class CommunicationGenerator:
         # Small percentage of people have blocked contacts
         if random.random() < 0.3:
             num_blocked = random.randint(1, 5)
-            return [str(uuid.uuid4()) for _ in range(num_blocked)]
+            return [next_uuid_str() for _ in range(num_blocked)]
         return []
\ No newline at end of file
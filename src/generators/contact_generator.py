@@ -2,6 +2,7 @@ import random
 import string
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime
+from itertools import accumulate
 import re
 
 from src.core.constants import AREA_CODES_BY_STATE, EMAIL_DOMAINS
@@ -9,6 +10,12 @@ from src.core.variability import VariabilityEngine
 from src.core.models import PhoneNumber, EmailAddress
 
 
+# Sampling tables derived from the constants once instead of on every call
+_ALL_AREA_CODES = [code for codes in AREA_CODES_BY_STATE.values() for code in codes]
+_PERSONAL_DOMAINS = [domain for domain, _ in EMAIL_DOMAINS["personal"]]
+_PERSONAL_DOMAIN_CUM_WEIGHTS = list(accumulate(weight for _, weight in EMAIL_DOMAINS["personal"]))
+
+
 class ContactGenerator:
     """Generator for phone numbers and email addresses with realistic patterns"""
     
@@ -83,7 +90,7 @@ class ContactGenerator:
         if state:
             area_code = self._get_area_code_for_state(state)
         else:
-            area_code = random.choice([code for codes in AREA_CODES_BY_STATE.values() for code in codes])
+            area_code = random.choice(_ALL_AREA_CODES)
         
         # Generate number parts
         exchange = self._generate_phone_exchange()
@@ -207,12 +214,8 @@ class ContactGenerator:
             else:
                 return f"{company_clean}.com"
         else:
-            # Personal email
-            domains = EMAIL_DOMAINS["personal"]
-            # Weighted selection
-            domain_names = [d[0] for d in domains]
-            weights = [d[1] for d in domains]
-            return random.choices(domain_names, weights=weights)[0]
+            # Personal email (weighted selection)
+            return random.choices(_PERSONAL_DOMAINS, cum_weights=_PERSONAL_DOMAIN_CUM_WEIGHTS)[0]
     
     def generate_email_address(self, first_name: str, last_name: str,
                              email_type: str = "personal",
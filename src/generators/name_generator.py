@@ -3,6 +3,7 @@ import string
 from datetime import datetime, date
 from typing import Dict, List, Optional, Tuple
 import math
+from itertools import accumulate
 
 from src.core.constants import (
     COMMON_FIRST_NAMES, ETHNIC_FIRST_NAMES, COMMON_LAST_NAMES,
@@ -11,6 +12,10 @@ from src.core.constants import (
 from src.core.variability import VariabilityEngine
 
 
+# Hyphenated surnames joined once at import instead of on every pick
+_HYPHENATED_JOINED = [f"{first}-{second}" for first, second in HYPHENATED_LAST_NAMES]
+
+
 class NameGenerator:
     """Advanced name generator with cultural diversity and realistic variations"""
     
@@ -72,11 +77,29 @@ class NameGenerator:
             "Samantha": ["Sam", "Sammy"]
         }
         
+        self._build_name_pools()
+        
+    def _build_name_pools(self):
+        """Precompute the sampling pools so per-name calls are plain lookups
+        
+        Call again after changing cultural_weights or name_popularity_by_decade.
+        """
+        self._cultural_backgrounds = list(self.cultural_weights)
+        self._cultural_cum_weights = list(accumulate(self.cultural_weights.values()))
+        
+        common_first = {g: set(COMMON_FIRST_NAMES[g]) for g in ("M", "F")}
+        self._period_names = {
+            (decade, gender): [n for n in names if n in common_first[gender]]
+            for decade, names in self.name_popularity_by_decade.items()
+            for gender in ("M", "F")
+        }
+        self._closest_decade = {}
+        
     def _select_cultural_background(self) -> str:
         """Select cultural background based on weights"""
         return random.choices(
-            list(self.cultural_weights.keys()),
-            weights=list(self.cultural_weights.values())
+            self._cultural_backgrounds,
+            cum_weights=self._cultural_cum_weights
         )[0]
     
     def _get_names_for_birth_year(self, birth_year: int, gender: str) -> List[str]:
@@ -84,15 +107,12 @@ class NameGenerator:
         decade = (birth_year // 10) * 10
         
         # Find closest decade
-        available_decades = list(self.name_popularity_by_decade.keys())
-        closest_decade = min(available_decades, key=lambda x: abs(x - decade))
+        closest_decade = self._closest_decade.get(decade)
+        if closest_decade is None:
+            closest_decade = min(self.name_popularity_by_decade, key=lambda x: abs(x - decade))
+            self._closest_decade[decade] = closest_decade
         
-        popular_names = self.name_popularity_by_decade.get(closest_decade, [])
-        
-        if gender == "M":
-            return [n for n in popular_names if n in COMMON_FIRST_NAMES["M"]]
-        else:
-            return [n for n in popular_names if n in COMMON_FIRST_NAMES["F"]]
+        return self._period_names[(closest_decade, "M" if gender == "M" else "F")]
     
     def generate_first_name(self, gender: str, birth_year: Optional[int] = None,
                           cultural_background: Optional[str] = None) -> str:
@@ -143,8 +163,7 @@ class NameGenerator:
         """Generate last name with possible hyphenation"""
         if random.random() < is_hyphenated:
             # Hyphenated last name
-            name_pair = random.choice(HYPHENATED_LAST_NAMES)
-            return f"{name_pair[0]}-{name_pair[1]}"
+            return random.choice(_HYPHENATED_JOINED)
         
         # Cultural last names could be added here
         # For now, use common last names
@@ -1,8 +1,10 @@
+import calendar
 import random
 from datetime import datetime, date, timedelta
 from typing import List, Dict, Optional, Tuple
 import uuid
 import logging
+from functools import cached_property
 
 from src.core.models import Person, Gender, GenerationConfig, rebuild_person_model
 from src.core.variability import VariabilityEngine
@@ -44,17 +46,6 @@ class PersonGenerator:
         self.financial_gen = FinancialGenerator(self.variability)
         self.employment_gen = EmploymentGenerator(self.variability)
         
-        # Initialize new comprehensive generators
-        self.medical_gen = MedicalGenerator(self.variability)
-        self.vehicle_gen = VehicleGenerator(self.variability)
-        self.education_gen = EducationGenerator(self.variability)
-        self.social_gen = SocialMediaGenerator(self.variability)
-        self.biometric_gen = BiometricGenerator(self.variability)
-        self.lifestyle_gen = LifestyleGenerator(self.variability)
-        self.travel_gen = TravelGenerator()
-        self.financial_transactions_gen = FinancialTransactionsGenerator()
-        self.communication_gen = CommunicationGenerator()
-        
         # Set random seed if provided
         if config.seed:
             random.seed(config.seed)
@@ -65,10 +56,47 @@ class PersonGenerator:
             logging.warning("Person model rebuild failed - new profiles may not work")
         
         # Track generated data for relationships
-        self.generated_people = []
         self.family_groups = []
         self.same_address_groups = []
-        
+    
+    # Comprehensive profile generators are created on first use, so callers
+    # that only need a subset of the profiles don't pay for building the rest
+    @cached_property
+    def medical_gen(self) -> MedicalGenerator:
+        return MedicalGenerator(self.variability)
+    
+    @cached_property
+    def vehicle_gen(self) -> VehicleGenerator:
+        return VehicleGenerator(self.variability)
+    
+    @cached_property
+    def education_gen(self) -> EducationGenerator:
+        return EducationGenerator(self.variability)
+    
+    @cached_property
+    def social_gen(self) -> SocialMediaGenerator:
+        return SocialMediaGenerator(self.variability)
+    
+    @cached_property
+    def biometric_gen(self) -> BiometricGenerator:
+        return BiometricGenerator(self.variability)
+    
+    @cached_property
+    def lifestyle_gen(self) -> LifestyleGenerator:
+        return LifestyleGenerator(self.variability)
+    
+    @cached_property
+    def travel_gen(self) -> TravelGenerator:
+        return TravelGenerator()
+    
+    @cached_property
+    def financial_transactions_gen(self) -> FinancialTransactionsGenerator:
+        return FinancialTransactionsGenerator()
+    
+    @cached_property
+    def communication_gen(self) -> CommunicationGenerator:
+        return CommunicationGenerator()
+    
     def _generate_birth_date(self) -> date:
         """Generate realistic birth date with age distribution"""
         # Age distribution (simplified US demographics)
@@ -116,6 +144,9 @@ class PersonGenerator:
         
         # If the birthday has already passed this year, we can add a year to birth_year
         if (birth_month < today.month) or (birth_month == today.month and birth_day <= today.day):
+            # A Feb 29 birthday moves to Feb 28 when the following year is not a leap year
+            if birth_month == 2 and birth_day == 29 and not calendar.isleap(birth_year + 1):
+                birth_day = 28
             birth_date = date(birth_year + 1, birth_month, birth_day)
         
         return birth_date
@@ -197,7 +228,8 @@ class PersonGenerator:
         addresses = self.address_gen.generate_address_history(num_addresses)
         
         # Get current state for other generators
-        current_address = next((a for a in addresses if a.address_type == "current"), addresses[0])
+        cached_current_address = next((a for a in addresses if a.address_type == "current"), None)
+        current_address = cached_current_address or addresses[0]
         current_state = current_address.state
         
         # Select industries for career
@@ -218,11 +250,13 @@ class PersonGenerator:
             employment_history = self.employment_gen.add_contractor_periods(employment_history)
             
             # Check if currently employed
-            is_employed = any(e.is_current for e in employment_history)
-            current_employer = next((e.employer_name for e in employment_history if e.is_current), None)
-            current_industry = next((e.industry for e in employment_history if e.is_current), industries[0])
+            current_job = next((e for e in employment_history if e.is_current), None)
+            is_employed = current_job is not None
+            current_employer = current_job.employer_name if current_job else None
+            current_industry = current_job.industry if current_job else industries[0]
         else:
             employment_history = []
+            current_job = None
             is_employed = False
             current_employer = None
             current_industry = None
@@ -364,12 +398,14 @@ class PersonGenerator:
             lifestyle_profile=lifestyle_profile,
             travel_profile=travel_profile,
             enhanced_financial_profile=enhanced_financial_profile,
-            communication_profile=communication_profile
+            communication_profile=communication_profile,
+            current_address=cached_current_address,
+            # generate_contact_set marks the first phone/email primary
+            primary_phone=phones[0] if phones else None,
+            primary_email=emails[0] if emails else None,
+            current_job=current_job
         )
         
-        # Track for relationships
-        self.generated_people.append(person)
-        
         return person
     
     def generate_related_people(self, base_person: Person, 
@@ -414,11 +450,12 @@ class PersonGenerator:
         
         # Share current address
         if base_person.addresses:
-            current_addr = next((a for a in base_person.addresses if a.address_type == "current"), None)
+            current_addr = base_person.current_address
             if current_addr:
                 spouse_addr = current_addr.model_copy()
                 spouse_addr.address_id = str(uuid.uuid4())
                 spouse.addresses = [spouse_addr] + spouse.addresses[1:]
+                spouse.current_address = spouse_addr
         
         return spouse
     
@@ -445,11 +482,12 @@ class PersonGenerator:
         # Share address if child is still relatively young (18-25)
         if child_age <= 25 and random.random() < 0.8:
             if base_person.addresses:
-                current_addr = next((a for a in base_person.addresses if a.address_type == "current"), None)
+                current_addr = base_person.current_address
                 if current_addr:
                     child_addr = current_addr.model_copy()
                     child_addr.address_id = str(uuid.uuid4())
                     child.addresses = [child_addr] + child.addresses[1:]
+                    child.current_address = child_addr
         
         return child
     
@@ -494,11 +532,12 @@ class PersonGenerator:
         
         # Share current address
         if base_person.addresses:
-            current_addr = next((a for a in base_person.addresses if a.address_type == "current"), None)
+            current_addr = base_person.current_address
             if current_addr:
                 roommate_addr = current_addr.model_copy()
                 roommate_addr.address_id = str(uuid.uuid4())
                 roommate.addresses = [roommate_addr] + roommate.addresses[1:]
+                roommate.current_address = roommate_addr
         
         return roommate
     
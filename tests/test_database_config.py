@@ -0,0 +1,48 @@
+import pytest
+
+from src.core.database_config import DatabaseConfig, ENV_VARS, _load_env_config
+
+
+PASSWORD_CONNECTION = {'server': 'db', 'database': 'pii', 'username': 'app', 'password': 'secret'}
+
+
+class TestBulkMode:
+    def test_bcp_rejects_individual_params(self):
+        with pytest.raises(ValueError, match="bcp"):
+            DatabaseConfig(database=PASSWORD_CONNECTION, data_insertion={'bulk_mode': 'bcp'})
+    
+    def test_bcp_accepts_connection_string(self):
+        config = DatabaseConfig(
+            database={'connection_method': 'connection_string',
+                      'connection_string': 'Server=db;Database=pii;Trusted_Connection=yes'},
+            data_insertion={'bulk_mode': 'bcp'}
+        )
+        
+        config.validate_bulk_mode()
+    
+    def test_executemany_accepts_individual_params(self):
+        DatabaseConfig(database=PASSWORD_CONNECTION).validate_bulk_mode()
+    
+    def test_bcp_set_after_construction_is_rejected(self):
+        config = DatabaseConfig(database=PASSWORD_CONNECTION)
+        config.data_insertion.bulk_mode = 'bcp'
+        
+        with pytest.raises(ValueError, match="bcp"):
+            config.validate_bulk_mode()
+    
+    def test_bcp_from_env_with_password_is_rejected(self, monkeypatch):
+        for name in ENV_VARS:
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv('DB_SERVER', 'db')
+        monkeypatch.setenv('DB_DATABASE', 'pii')
+        monkeypatch.setenv('DB_USERNAME', 'app')
+        monkeypatch.setenv('DB_PASSWORD', 'secret')
+        monkeypatch.setenv('DB_BULK_MODE', 'bcp')
+        _load_env_config.cache_clear()
+        
+        with pytest.raises(ValueError, match="bcp"):
+            DatabaseConfig.from_env()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -3,8 +3,9 @@ import random
 from datetime import date, datetime
 from typing import List
 
-from src.core.models import GenerationConfig, DataQualityProfile, Gender
+from src.core.models import GenerationConfig, DataQualityProfile, Gender, Person
 from src.core.variability import VariabilityEngine
+from src.core.sampling import BatchSampler
 from src.generators.name_generator import NameGenerator
 from src.generators.address_generator import AddressGenerator
 from src.generators.contact_generator import ContactGenerator
@@ -104,6 +105,11 @@ class TestAddressGenerator:
         # Should have at least one current address
         current_addresses = [a for a in addresses if a.address_type == "current"]
         assert len(current_addresses) >= 1
+    
+    def test_address_type_is_plain_string(self):
+        for _ in range(20):
+            for address in self.generator.generate_address_history(3):
+                assert type(address.address_type) is str
 
 
 class TestContactGenerator:
@@ -274,6 +280,37 @@ class TestPersonGenerator:
         # Should have at least one address
         assert len(person.addresses) >= 1
     
+    def test_primary_records_cached(self):
+        for family in self.generator.create_family_clusters(3):
+            for person in family:
+                assert person.current_address is next(
+                    (a for a in person.addresses if a.address_type == "current"), None)
+                assert person.primary_phone is next(
+                    (p for p in person.phone_numbers if p.is_primary), None)
+                assert person.primary_email is next(
+                    (e for e in person.email_addresses if e.is_primary), None)
+                assert person.current_job is next(
+                    (e for e in person.employment_history if e.is_current), None)
+                assert 'current_address' not in person.model_dump()
+    
+    def test_primary_records_cached_on_construction(self):
+        person = self.generator.generate_person()
+        rebuilt = Person(
+            first_name=person.first_name,
+            last_name=person.last_name,
+            date_of_birth=person.date_of_birth,
+            gender=person.gender,
+            addresses=person.addresses,
+            phone_numbers=person.phone_numbers,
+            email_addresses=person.email_addresses,
+            employment_history=person.employment_history
+        )
+        
+        assert rebuilt.current_address is person.current_address
+        assert rebuilt.primary_phone is person.primary_phone
+        assert rebuilt.primary_email is person.primary_email
+        assert rebuilt.current_job is person.current_job
+    
     def test_generate_family_clusters(self):
         families = self.generator.create_family_clusters(2)
         
@@ -328,6 +365,24 @@ class TestDataQuality:
         assert unique_formats > 1
 
 
+class TestBatchSampler:
+    def test_reproducible_with_random_seed(self):
+        def draw():
+            random.seed(7)
+            return BatchSampler(50).choice('pick', ['a', 'b', 'c'], [1, 1, 8]).integers('n', 3, 8).columns
+        
+        assert draw() == draw()
+    
+    def test_rows_and_ranges(self):
+        sampler = BatchSampler(1000).choice('pick', ['a', 'b'], [0, 1]).integers('n', 3, 8).uniform('u')
+        
+        assert len(sampler) == 1000
+        assert set(sampler.columns['pick']) == {'b'}
+        assert set(sampler.columns['n']) == set(range(3, 9))
+        assert all(0 <= u < 1 for u in sampler.columns['u'])
+        assert sampler[0] == {'pick': 'b', 'n': sampler.columns['n'][0], 'u': sampler.columns['u'][0]}
+
+
 def test_statistical_distributions():
     """Test that generated data follows expected statistical patterns"""
     config = GenerationConfig(
@@ -0,0 +1,62 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _run_fresh(code: str) -> subprocess.CompletedProcess:
+    """Run code in a new interpreter, so no earlier test has built a Person yet"""
+    return subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT,
+                          capture_output=True, text=True, timeout=120)
+
+
+class TestPersonModel:
+    def test_model_validate_on_fresh_import(self):
+        result = _run_fresh(
+            "from src.core.models import Person\n"
+            "person = Person.model_validate({'ssn': '123-45-6789', 'first_name': 'Ann', 'last_name': 'Lee',"
+            " 'date_of_birth': '1980-01-02', 'gender': 'F'})\n"
+            "print(person.first_name, person.date_of_birth)\n"
+        )
+        
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split() == ['Ann', '1980-01-02']
+    
+    def test_model_json_schema_on_fresh_import(self):
+        result = _run_fresh(
+            "from src.core.models import Person\n"
+            "print('medical_profile' in Person.model_json_schema()['properties'])\n"
+        )
+        
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == 'True'
+    
+    def test_model_validate_json_on_fresh_import(self):
+        result = _run_fresh(
+            "from src.core.models import Person\n"
+            "person = Person.model_validate_json('{\"first_name\": \"Ann\", \"last_name\": \"Lee\","
+            " \"date_of_birth\": \"1980-01-02\", \"gender\": \"F\"}')\n"
+            "print(person.last_name)\n"
+        )
+        
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == 'Lee'
+    
+    def test_import_does_not_load_profile_generators(self):
+        result = _run_fresh(
+            "import sys\n"
+            "import src.core.models\n"
+            "print('src.generators.medical_generator' in sys.modules)\n"
+            "src.core.models.Person(first_name='Ann', last_name='Lee', date_of_birth='1980-01-02', gender='F')\n"
+            "print('src.generators.medical_generator' in sys.modules)\n"
+        )
+        
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split() == ['False', 'True']
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
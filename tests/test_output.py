@@ -0,0 +1,147 @@
+import json
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import pytest
+from click.testing import CliRunner
+
+from pii_gen import OUTPUT_FORMATS, OutputWriter, cli, write_output
+from src.core.models import GenerationConfig
+from src.generators.person_generator import PersonGenerator
+
+FORMATS = list(OUTPUT_FORMATS)
+
+
+def _read_back(path, output_format) -> pa.Table:
+    """Load an output file into an Arrow table"""
+    path = Path(path)
+    if output_format == 'csv':
+        return pa_csv.read_csv(path, convert_options=pa_csv.ConvertOptions(
+            column_types={'person_id': pa.string(), 'ssn': pa.string()},
+            strings_can_be_null=True,
+        ))
+    if output_format == 'ndjson':
+        return pa.Table.from_pylist([json.loads(line) for line in path.read_text().splitlines()])
+    if output_format == 'json':
+        return pa.Table.from_pylist(json.loads(path.read_text()))
+    if output_format == 'parquet':
+        return pq.read_table(path)
+    with pa.ipc.open_stream(path) as reader:
+        return reader.read_all()
+
+
+class TestOutputRoundTrip:
+    def setup_method(self):
+        generator = PersonGenerator(GenerationConfig(seed=42))
+        self.people = [generator.generate_person() for _ in range(23)]
+
+    @pytest.mark.parametrize('output_format', FORMATS)
+    def test_write_output_in_chunks(self, tmp_path, output_format):
+        path = tmp_path / f'people{OUTPUT_FORMATS[output_format]}'
+        
+        # 23 records in chunks of 5 exercises several batches plus a short last one
+        write_output(iter(self.people), str(path), chunk_size=5)
+        table = _read_back(path, output_format)
+        
+        assert table.num_rows == len(self.people)
+        assert table.column('person_id').to_pylist() == [p.person_id for p in self.people]
+        assert table.column('ssn').to_pylist() == [p.ssn for p in self.people]
+        assert table.column('last_name').to_pylist() == [p.last_name for p in self.people]
+
+    @pytest.mark.parametrize('output_format', FORMATS)
+    def test_output_writer_batches(self, tmp_path, output_format):
+        writer = OutputWriter(str(tmp_path / 'people'), output_format)
+        writer.write_batch(self.people[:10])
+        writer.write_batch([])
+        writer.write_batch(self.people[10:])
+        writer.close()
+        
+        table = _read_back(writer.output_path, output_format)
+        
+        assert writer.output_path.endswith(OUTPUT_FORMATS[output_format])
+        assert writer.records_written == len(self.people)
+        assert table.column('person_id').to_pylist() == [p.person_id for p in self.people]
+
+    @pytest.mark.parametrize('output_format', FORMATS)
+    def test_empty_output_is_readable(self, tmp_path, output_format):
+        path = tmp_path / f'people{OUTPUT_FORMATS[output_format]}'
+        
+        write_output([], str(path))
+        
+        if output_format == 'json':
+            assert json.loads(path.read_text()) == []
+        elif output_format == 'ndjson':
+            assert path.read_text() == ''
+        else:
+            assert _read_back(path, output_format).num_rows == 0
+
+    @pytest.mark.parametrize('output_format', ['parquet', 'arrow'])
+    def test_low_cardinality_columns_are_dictionary_encoded(self, tmp_path, output_format):
+        path = tmp_path / f'people{OUTPUT_FORMATS[output_format]}'
+        
+        write_output(self.people, str(path), chunk_size=10)
+        table = _read_back(path, output_format)
+        
+        for name in ('gender', 'city', 'state'):
+            assert pa.types.is_dictionary(table.schema.field(name).type)
+        assert pa.types.is_date32(table.schema.field('date_of_birth').type)
+        assert table.column('gender').to_pylist() == [p.gender for p in self.people]
+        assert table.column('state').to_pylist() == [
+            p.current_address.state if p.current_address else None for p in self.people
+        ]
+
+
+class TestOutputPath:
+    @pytest.mark.parametrize('output_path, output_format, expected', [
+        ('out.csv', None, 'out.csv'),
+        ('out.ndjson', None, 'out.ndjson'),
+        ('out.json', None, 'out.json'),
+        ('out', None, 'out.csv'),
+        ('out', 'arrow', 'out.arrow'),
+        ('out.parquet', 'parquet', 'out.parquet'),
+        ('out.csv', 'parquet', 'out.parquet'),
+        ('out.json', 'ndjson', 'out.ndjson'),
+        ('out.ndjson', 'json', 'out.json'),
+        ('out.v1', 'csv', 'out.v1.csv'),
+    ])
+    def test_output_path_matches_format(self, tmp_path, output_path, output_format, expected):
+        writer = OutputWriter(str(tmp_path / output_path), output_format)
+        writer.close()
+        
+        assert writer.output_path == str(tmp_path / expected)
+        assert writer.output_path.endswith(OUTPUT_FORMATS[writer.format])
+        assert [p.name for p in tmp_path.iterdir()] == [expected]
+
+
+class TestGenerateCommand:
+    def setup_method(self):
+        self.runner = CliRunner()
+
+    def _generate(self, *args):
+        result = self.runner.invoke(cli, [
+            'generate', '-n', '12', '-b', '5', '-t', '2', '--mode', 'thread', '--seed', '7', *args
+        ])
+        assert result.exit_code == 0, result.output
+        return result
+
+    @pytest.mark.parametrize('output_format', FORMATS)
+    def test_generate_writes_every_format(self, tmp_path, output_format):
+        path = tmp_path / f'people{OUTPUT_FORMATS[output_format]}'
+        
+        self._generate('-o', str(path), '--format', output_format)
+        table = _read_back(path, output_format)
+        
+        assert table.num_rows == 12
+        assert len(set(table.column('person_id').to_pylist())) == 12
+
+    def test_format_overrides_mismatched_extension(self, tmp_path):
+        self._generate('-o', str(tmp_path / 'people.csv'), '--format', 'parquet')
+        
+        assert [p.name for p in tmp_path.iterdir()] == ['people.parquet']
+        assert pq.read_table(tmp_path / 'people.parquet').num_rows == 12
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,159 @@
+import itertools
+import random
+import time
+
+import pytest
+
+from src.core.models import GenerationConfig
+from src.core.performance import PerformanceOptimizer, StreamingBuffer
+
+
+def _wait_for(condition, timeout=5.0):
+    """Poll until condition() is true; False if it never became true"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TestGenerateParallel:
+    def test_process_mode_generates_every_record(self):
+        optimizer = PerformanceOptimizer(GenerationConfig(batch_size=10, num_threads=2, seed=42))
+        
+        batches = list(optimizer.generate_parallel(None, 25, batch_size=10, num_processes=2, mode='process'))
+        
+        assert sorted(len(batch) for batch in batches) == [5, 10, 10]
+        assert len({person.person_id for batch in batches for person in batch}) == 25
+        assert optimizer.records_generated == 25
+
+    def test_thread_mode_generates_every_record(self):
+        optimizer = PerformanceOptimizer(GenerationConfig(batch_size=10, num_threads=2))
+        
+        batches = list(optimizer.generate_parallel(None, 15, batch_size=10, num_processes=2, mode='thread'))
+        
+        assert sum(len(batch) for batch in batches) == 15
+    
+    def test_thread_workers_do_not_reseed_shared_random(self, monkeypatch):
+        seeds = []
+        real_seed = random.seed
+        monkeypatch.setattr(random, 'seed', lambda *args, **kwargs: (seeds.append(args), real_seed(*args, **kwargs)))
+        optimizer = PerformanceOptimizer(GenerationConfig(batch_size=5, num_threads=3, seed=42))
+        
+        batches = list(optimizer.generate_parallel(None, 30, batch_size=5, num_processes=3, mode='thread'))
+        
+        assert sum(len(batch) for batch in batches) == 30
+        # Seeded once up front, never again by a worker thread
+        assert seeds == [(42,)]
+
+
+
+class TestStreamGenerate:
+    def test_rate_holds_after_consumer_stalls(self):
+        optimizer = PerformanceOptimizer(GenerationConfig())
+        stream = optimizer.stream_generate(itertools.count().__next__, rate_per_second=50)
+        next(stream)
+        
+        # Stalling for 25 intervals must not bank 25 records to emit back-to-back
+        time.sleep(0.5)
+        start = time.monotonic()
+        records = [next(stream) for _ in range(11)]
+        elapsed = time.monotonic() - start
+        stream.close()
+        
+        assert records == list(range(1, 12))
+        # The first record after the stall is due at once, the other ten 20 ms apart
+        assert elapsed >= 0.18
+
+
+class TestStreamingBuffer:
+    def setup_method(self):
+        self.counter = itertools.count()
+        self.produced = 0
+    
+    def _next_record(self):
+        self.produced += 1
+        return next(self.counter)
+    
+    def test_consumer_receives_every_record_in_order(self):
+        buffer = StreamingBuffer(max_size=20, batch_size=10)
+        buffer.start_producer(self._next_record, 25)
+        
+        batches = list(buffer.consume())
+        
+        assert [len(batch) for batch in batches] == [10, 10, 5]
+        assert [record for batch in batches for record in batch] == list(range(25))
+        assert _wait_for(lambda: not buffer.producer_thread.is_alive())
+    
+    @pytest.mark.parametrize('batch_size, sizes', [(4, [4, 4, 4, 4, 4, 4, 1]), (25, [25]), (10, [10, 10, 5])])
+    def test_consume_rechunks_to_batch_size(self, batch_size, sizes):
+        buffer = StreamingBuffer(max_size=20, batch_size=10)
+        buffer.start_producer(self._next_record, 25)
+        
+        batches = list(buffer.consume(batch_size=batch_size))
+        
+        assert [len(batch) for batch in batches] == sizes
+        assert [record for batch in batches for record in batch] == list(range(25))
+    
+    def test_zero_records_completes(self):
+        buffer = StreamingBuffer()
+        buffer.start_producer(self._next_record, 0)
+        
+        assert list(buffer.consume()) == []
+    
+    def test_byte_bound_blocks_until_a_batch_is_consumed(self):
+        # Two 10-byte records per batch: a second batch would exceed 30 bytes
+        buffer = StreamingBuffer(batch_size=2, max_bytes=30, record_size=lambda record: 10)
+        buffer.start_producer(self._next_record, 6)
+        
+        # The producer generates the second batch, then waits for room
+        assert _wait_for(lambda: self.produced == 4)
+        time.sleep(0.2)
+        assert buffer.queue.qsize() == 1
+        assert buffer._queued_bytes == 20
+        assert buffer.producer_thread.is_alive()
+        
+        batches = buffer.consume()
+        assert next(batches) == [0, 1]
+        
+        # Consuming freed the room, so the producer moves on
+        assert _wait_for(lambda: self.produced == 6)
+        assert list(batches) == [[2, 3], [4, 5]]
+        assert buffer._queued_bytes == 0
+    
+    def test_oversized_batch_fits_an_empty_buffer(self):
+        buffer = StreamingBuffer(batch_size=5, max_bytes=10, record_size=lambda record: 10)
+        buffer.start_producer(self._next_record, 10)
+        
+        assert [len(batch) for batch in buffer.consume()] == [5, 5]
+    
+    def test_stop_releases_producer_blocked_on_full_queue(self):
+        # Room for two single-record batches; the third put blocks
+        buffer = StreamingBuffer(max_size=2, batch_size=1)
+        buffer.start_producer(self._next_record, 1000)
+        assert _wait_for(lambda: self.produced == 3)
+        time.sleep(0.2)
+        assert buffer.producer_thread.is_alive()
+        
+        buffer.stop()
+        
+        assert not buffer.producer_thread.is_alive()
+        assert self.produced < 1000
+    
+    def test_stop_releases_producer_blocked_on_byte_bound(self):
+        buffer = StreamingBuffer(batch_size=1, max_bytes=10, record_size=lambda record: 10)
+        buffer.start_producer(self._next_record, 1000)
+        assert _wait_for(lambda: self.produced == 2)
+        time.sleep(0.2)
+        assert buffer.producer_thread.is_alive()
+        
+        buffer.stop()
+        
+        assert not buffer.producer_thread.is_alive()
+        assert self.produced < 1000
+        assert buffer._queued_bytes == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,117 @@
+import datetime
+
+import pytest
+
+from src.core.models import GenerationConfig
+from src.core.validation import DataValidator, _INVALID_SSNS
+from src.generators.person_generator import PersonGenerator
+
+
+def _years_ago(today: datetime.date, years: int) -> datetime.date:
+    """The date whose birthday is today, years ago (Feb 29 falls back to Feb 28)"""
+    try:
+        return today.replace(year=today.year - years)
+    except ValueError:
+        return today.replace(year=today.year - years, day=28)
+
+
+def _record(**fields):
+    """A minimal valid person record with the given fields overridden"""
+    record = {
+        'ssn': '234-56-7890',
+        'first_name': 'Ann',
+        'last_name': 'Lee',
+        'date_of_birth': datetime.date(1980, 1, 2),
+        'gender': 'F',
+        'financial_profile': {'credit_score': 700, 'annual_income': 55000.0, 'debt_to_income_ratio': 0.3},
+    }
+    record.update(fields)
+    return record
+
+
+class TestValidatePersons:
+    def setup_method(self):
+        self.validator = DataValidator()
+
+    def _assert_parity(self, records):
+        batch = self.validator.validate_persons(records)
+        
+        assert len(batch) == len(records)
+        for record, results in zip(records, batch):
+            assert results == self.validator.validate_person(record), record
+
+    def test_generated_records(self):
+        generator = PersonGenerator(GenerationConfig(seed=42))
+        records = []
+        for _ in range(100):
+            record = generator.generate_person().model_dump(exclude_none=True)
+            # Email validation checks deliverability over DNS; it is not batched
+            record.pop('email_addresses', None)
+            records.append(record)
+        
+        self._assert_parity(records)
+
+    def test_date_of_birth_edge_cases(self):
+        today = datetime.date.today()
+        dobs = [
+            today,
+            _years_ago(today, 17),
+            _years_ago(today, 17) - datetime.timedelta(days=1),
+            _years_ago(today, 18),
+            _years_ago(today, 18) + datetime.timedelta(days=1),
+            _years_ago(today, 150),
+            _years_ago(today, 151),
+            _years_ago(today, 151) + datetime.timedelta(days=1),
+            today + datetime.timedelta(days=1),
+            _years_ago(today, -1),
+            today.isoformat(),
+            '1980-13-01',
+            None,
+        ]
+        records = [_record(date_of_birth=dob) for dob in dobs]
+        
+        self._assert_parity(records)
+        # The edge cases really do hit the different branches
+        messages = [{r.message for r in results} for results in self.validator.validate_persons(records)]
+        assert messages[0] == set()
+        assert 'Person is a minor' in messages[1]
+        assert messages[3] == set()
+        assert 'Person is a minor' in messages[4]
+        assert messages[5] == set()
+        assert 'Age exceeds realistic maximum' in messages[6]
+        assert 'Date of birth cannot be in the future' in messages[8]
+
+    def test_ssn_edge_cases(self):
+        ssns = [
+            '000-12-3456', '666-12-3456', '900-12-3456', '999-99-9999', '899-12-3456',
+            '234567890', '234.56.7890', '234-56-789', '', None, 123456789, '２３４-56-7890',
+            *sorted(_INVALID_SSNS),
+            *(f'{ssn[:3]}-{ssn[3:5]}-{ssn[5:]}' for ssn in sorted(_INVALID_SSNS)),
+        ]
+        records = [_record(ssn=ssn) for ssn in ssns]
+        
+        self._assert_parity(records)
+        assert all(self.validator.validate_persons([_record(ssn=ssn)])[0] for ssn in _INVALID_SSNS)
+
+    def test_financial_edge_cases(self):
+        profiles = [
+            {},
+            {'credit_score': '700'},
+            {'credit_score': 299},
+            {'credit_score': 851},
+            {'credit_score': 300, 'annual_income': 0, 'debt_to_income_ratio': 10},
+            {'annual_income': -1},
+            {'debt_to_income_ratio': -0.1},
+            {'debt_to_income_ratio': 10.5},
+            {'credit_score': None, 'annual_income': None},
+        ]
+        records = [_record(financial_profile=profile) for profile in profiles]
+        missing = _record()
+        del missing['financial_profile']
+        records.append(missing)
+        
+        self._assert_parity(records)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -32,7 +32,7 @@ from src.generators.travel_generator import TravelProfile
 from src.generators.financial_transactions_generator import FinancialProfile as EnhancedFinancialProfile
 from src.generators.communication_generator import CommunicationProfile
 
-from src.core.models import GenerationConfig, DataQualityProfile, Person, rebuild_person_model
+from src.core.models import GenerationConfig, VARIABILITY_PROFILES, Person, rebuild_person_model
 from src.core.performance import PerformanceOptimizer
 
 # Force model rebuild here before any other imports
@@ -46,7 +46,7 @@ from src.core.error_handling import error_handler, ErrorCategory, ErrorSeverity
 from src.core.validation import DataValidator
 from src.core.progress_tracker import (
     progress_tracker, WebSocketProgressNotifier, 
-    TaskType, TaskStatus
+    TaskType, TaskStatus, socketio_json_options
 )
 
 # Configure enhanced logging first
@@ -68,7 +68,8 @@ app.config['SECRET_KEY'] = 'pii-generator-enhanced-secret-key'
 
 # Initialize SocketIO for real-time updates if available
 if SOCKETIO_AVAILABLE:
-    socketio = SocketIO(app, cors_allowed_origins="*", async_mode='eventlet')
+    socketio = SocketIO(app, cors_allowed_origins="*", async_mode='eventlet',
+                        **socketio_json_options())
 else:
     socketio = None
 
@@ -165,32 +166,12 @@ def _generate_data_background(task_id, num_records, variability_profile,
         # Only use progress tracker - avoid WebSocket calls from background thread
         progress_tracker.start_task(task_id, "Initializing generators")
         
-        # Create data quality profile based on selection
-        profiles = {
-            'minimal': DataQualityProfile(
-                missing_data_rate=0.01, typo_rate=0.005, duplicate_rate=0.0001,
-                outlier_rate=0.001, inconsistency_rate=0.01
-            ),
-            'realistic': DataQualityProfile(
-                missing_data_rate=0.05, typo_rate=0.02, duplicate_rate=0.001,
-                outlier_rate=0.01, inconsistency_rate=0.03
-            ),
-            'messy': DataQualityProfile(
-                missing_data_rate=0.15, typo_rate=0.05, duplicate_rate=0.005,
-                outlier_rate=0.03, inconsistency_rate=0.08
-            ),
-            'extreme': DataQualityProfile(
-                missing_data_rate=0.25, typo_rate=0.10, duplicate_rate=0.01,
-                outlier_rate=0.05, inconsistency_rate=0.15
-            )
-        }
-        
         # Create generation config with error recovery
         config = GenerationConfig(
             num_records=num_records,
             batch_size=batch_size,
             num_threads=num_threads,
-            data_quality_profile=profiles[variability_profile]
+            data_quality_profile=VARIABILITY_PROFILES[variability_profile]
         )
         
         # Initialize generators with error handling